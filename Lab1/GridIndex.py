@@ -0,0 +1,137 @@
+import heapq
+from typing import Generator, Iterable
+from Point2d import Point2d, WIDTH, HEIGHT
+from Vector2d import Vector2d
+
+
+def distance(start : Point2d, end : Point2d) -> float:
+    return abs(Vector2d.from_points(start, end))
+
+
+class GridIndex:
+    _cell_size : int
+    _columns : int
+    _rows : int
+    _cells : list[list[Point2d]]
+    _count : int
+
+    def __init__(self, points : Iterable[Point2d] = (), cell_size : int = 10) -> None:
+        if cell_size <= 0:
+            raise ValueError("cell_size must be positive")
+        self._cell_size = cell_size
+        self._columns = WIDTH // cell_size + 1
+        self._rows = HEIGHT // cell_size + 1
+        self._cells = [[] for _ in range(self._columns * self._rows)]
+        self._count = 0
+        self.bulk_load(points)
+
+    @property
+    def cell_size(self) -> int:
+        return self._cell_size
+
+    def _cell_of(self, x : int, y : int) -> int:
+        return (y // self._cell_size) * self._columns + x // self._cell_size
+
+    def bulk_load(self, points : Iterable[Point2d]) -> None:
+        cells = self._cells
+        size = self._cell_size
+        columns = self._columns
+        count = 0
+        for point in points:
+            cells[(point.y // size) * columns + point.x // size].append(point)
+            count += 1
+        self._count += count
+
+    def insert(self, point : Point2d) -> None:
+        self._cells[self._cell_of(point.x, point.y)].append(point)
+        self._count += 1
+
+    def remove(self, point : Point2d) -> None:
+        bucket = self._cells[self._cell_of(point.x, point.y)]
+        for i, candidate in enumerate(bucket):
+            if candidate == point:
+                bucket[i] = bucket[-1]
+                bucket.pop()
+                self._count -= 1
+                return
+        raise ValueError(f"{point} not in GridIndex")
+
+    def __len__(self) -> int:
+        return self._count
+
+    def __contains__(self, point : Point2d) -> bool:
+        return point in self._cells[self._cell_of(point.x, point.y)]
+
+    def __iter__(self) -> Generator:
+        for bucket in self._cells:
+            yield from bucket
+
+    def query_rect(self, bottom_left : Point2d, top_right : Point2d) -> list[Point2d]:
+        x_min, y_min = bottom_left.x, bottom_left.y
+        x_max, y_max = top_right.x, top_right.y
+        if x_min > x_max or y_min > y_max:
+            return []
+        size = self._cell_size
+        result = []
+        for row in range(y_min // size, y_max // size + 1):
+            row_inside = row * size >= y_min and (row + 1) * size - 1 <= y_max
+            for column in range(x_min // size, x_max // size + 1):
+                bucket = self._cells[row * self._columns + column]
+                if row_inside and column * size >= x_min and (column + 1) * size - 1 <= x_max:
+                    result.extend(bucket)
+                else:
+                    result.extend(p for p in bucket if x_min <= p.x <= x_max and y_min <= p.y <= y_max)
+        return result
+
+    def query_radius(self, center : Point2d, radius : float) -> list[Point2d]:
+        if radius < 0:
+            return []
+        cx, cy = center.x, center.y
+        size = self._cell_size
+        radius_sq = radius * radius
+        first_column = max(0, int(cx - radius) // size)
+        last_column = min(self._columns - 1, int(cx + radius) // size)
+        first_row = max(0, int(cy - radius) // size)
+        last_row = min(self._rows - 1, int(cy + radius) // size)
+        result = []
+        for row in range(first_row, last_row + 1):
+            for column in range(first_column, last_column + 1):
+                for p in self._cells[row * self._columns + column]:
+                    dx = p.x - cx
+                    dy = p.y - cy
+                    if dx * dx + dy * dy <= radius_sq:
+                        result.append(p)
+        return result
+
+    def nearest(self, center : Point2d, k : int = 1) -> list[Point2d]:
+        if k <= 0 or self._count == 0:
+            return []
+        cx, cy = center.x, center.y
+        size = self._cell_size
+        center_column = cx // size
+        center_row = cy // size
+        max_ring = max(center_column, self._columns - 1 - center_column,
+                       center_row, self._rows - 1 - center_row)
+        heap: list[tuple[int, int, Point2d]] = []
+        order = 0
+        for ring in range(max_ring + 1):
+            for row in range(center_row - ring, center_row + ring + 1):
+                if not 0 <= row < self._rows:
+                    continue
+                edge_row = row == center_row - ring or row == center_row + ring
+                step = 1 if edge_row else 2 * ring
+                for column in range(center_column - ring, center_column + ring + 1, max(step, 1)):
+                    if not 0 <= column < self._columns:
+                        continue
+                    for p in self._cells[row * self._columns + column]:
+                        dx = p.x - cx
+                        dy = p.y - cy
+                        item = (-(dx * dx + dy * dy), -order, p)
+                        order += 1
+                        if len(heap) < k:
+                            heapq.heappush(heap, item)
+                        elif item > heap[0]:
+                            heapq.heapreplace(heap, item)
+            if len(heap) == k and -heap[0][0] <= (ring * size) ** 2:
+                break
+        return [p for _, _, p in sorted(heap, reverse=True)]
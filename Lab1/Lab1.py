@@ -1,6 +1,7 @@
 import random
 from Point2d import Point2d, HEIGHT, WIDTH
 from Vector2d import Vector2d
+from Vector2dArray import Vector2dArray
 
 
 def main():
@@ -61,6 +62,18 @@ def main():
     vec3 = vec1+vec2
     print(f"Смешанное произведение {vec1}.triple_product({vec2},{vec3}) = {vec1.triple_product(vec2,vec3)}")
     print(f"Статическое смешанное произведение Vector2d.triple_product_static({vec1},{vec2},{vec3}) = {Vector2d.triple_product_static(vec1, vec2, vec3)}")
-    
+    print()
+
+    print("Класс Vector2dArray:")
+    arr1 = Vector2dArray.from_vectors([vec1, vec2, vec3])
+    arr2 = Vector2dArray.from_points([a, b, a], [b, a, a])
+    print(f"arr1 = {arr1}")
+    print(f"arr2 = {arr2}")
+    print(f"arr1[0] = {arr1[0]}")
+    print(f"arr1 + arr2 = {arr1 + arr2}")
+    print(f"arr1.dot_product(arr2) = {arr1.dot_product(arr2).tolist()}")
+    print(f"arr1.cross_product(arr2) = {arr1.cross_product(arr2)}")
+    print(f"abs(arr1) = {abs(arr1).tolist()}")
+
 if __name__ == "__main__":
     main()
\ No newline at end of file
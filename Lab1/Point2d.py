@@ -2,6 +2,7 @@ WIDTH = 100
 HEIGHT = 100
 
 class Point2d:
+    __slots__ = ('_x', '_y')
     _x : int
     _y : int
 
@@ -9,6 +10,13 @@ class Point2d:
         self.x = x
         self.y = y
 
+    @classmethod
+    def unchecked(cls, x : int, y : int) -> 'Point2d':
+        point = object.__new__(cls)
+        point._x = x
+        point._y = y
+        return point
+
     @property
     def x(self) -> int:
         return self._x
@@ -37,6 +45,9 @@ class Point2d:
     def __ne__(self, other : 'Point2d')-> bool:
         return not (self == other)
 
+    def __hash__(self) -> int:
+        return hash((self._x, self._y))
+
     def __str__(self) -> str:
         return f"P2d({self.x},{self.y})"
 
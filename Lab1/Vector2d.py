@@ -2,6 +2,7 @@ from typing import Generator
 from Point2d import Point2d
 
 class Vector2d:
+    __slots__ = ('_x', '_y')
     _x : int
     _y : int
 
@@ -9,6 +10,13 @@ class Vector2d:
         self.x = x
         self.y = y
 
+    @classmethod
+    def unchecked(cls, x : int, y : int) -> 'Vector2d':
+        vector = object.__new__(cls)
+        vector._x = x
+        vector._y = y
+        return vector
+
     @classmethod
     def from_points(cls, start: Point2d, end: Point2d) -> 'Vector2d':
         return cls(end.x - start.x, end.y - start.y)
@@ -60,6 +68,9 @@ class Vector2d:
     def __ne__(self, other : 'Vector2d') -> bool:
         return not(self == other)
 
+    def __hash__(self) -> int:
+        return hash((self._x, self._y))
+
     def __str__(self) -> str:
         return f"V2d({self.x},{self.y})"
 
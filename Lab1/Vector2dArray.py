@@ -0,0 +1,131 @@
+from array import array
+from operator import add, sub, mul
+from typing import Generator, Iterable, Sequence
+from Point2d import Point2d
+from Vector2d import Vector2d
+
+TYPECODE = 'q'
+
+
+class Vector2dArray:
+    _xs : array
+    _ys : array
+
+    def __init__(self, xs : Iterable[int] = (), ys : Iterable[int] = ()) -> None:
+        self._xs = xs if isinstance(xs, array) and xs.typecode == TYPECODE else array(TYPECODE, xs)
+        self._ys = ys if isinstance(ys, array) and ys.typecode == TYPECODE else array(TYPECODE, ys)
+        if len(self._xs) != len(self._ys):
+            raise ValueError("Vector2dArray: x and y columns must have the same length")
+
+    @classmethod
+    def from_vectors(cls, vectors : Iterable[Vector2d]) -> 'Vector2dArray':
+        xs = array(TYPECODE)
+        ys = array(TYPECODE)
+        for vector in vectors:
+            xs.append(vector.x)
+            ys.append(vector.y)
+        return cls(xs, ys)
+
+    @classmethod
+    def from_points(cls, starts : Sequence[Point2d], ends : Sequence[Point2d]) -> 'Vector2dArray':
+        if len(starts) != len(ends):
+            raise ValueError("Vector2dArray: starts and ends must have the same length")
+        return cls(array(TYPECODE, [end.x - start.x for start, end in zip(starts, ends)]),
+                   array(TYPECODE, [end.y - start.y for start, end in zip(starts, ends)]))
+
+    @property
+    def xs(self) -> array:
+        return self._xs
+
+    @property
+    def ys(self) -> array:
+        return self._ys
+
+    def _check_length(self, other : 'Vector2dArray') -> None:
+        if len(self._xs) != len(other._xs):
+            raise ValueError("Vector2dArray: arrays must have the same length")
+
+    def __getitem__(self, index : int | slice) -> 'Vector2d | Vector2dArray':
+        if isinstance(index, slice):
+            return Vector2dArray(self._xs[index], self._ys[index])
+        try:
+            return Vector2d.unchecked(self._xs[index], self._ys[index])
+        except IndexError:
+            raise IndexError("Vector2dArray: index out of range") from None
+
+    def __setitem__(self, index : int, value : Vector2d) -> None:
+        try:
+            self._xs[index] = value.x
+            self._ys[index] = value.y
+        except IndexError:
+            raise IndexError("Vector2dArray: index out of range") from None
+
+    def __iter__(self) -> Generator:
+        for x, y in zip(self._xs, self._ys):
+            yield Vector2d.unchecked(x, y)
+
+    def __len__(self) -> int:
+        return len(self._xs)
+
+    def __eq__(self, other : 'Vector2dArray') -> bool:
+        return self._xs == other._xs and self._ys == other._ys
+
+    def __ne__(self, other : 'Vector2dArray') -> bool:
+        return not(self == other)
+
+    def __str__(self) -> str:
+        return f"V2dArray[{', '.join(str(vector) for vector in self)}]"
+
+    def __repr__(self) -> str:
+        return f"Vector2dArray(xs = {self._xs.tolist()}, ys = {self._ys.tolist()})"
+
+    def __abs__(self) -> array:
+        return array('d', [(x*x + y*y)**0.5 for x, y in zip(self._xs, self._ys)])
+
+    def __add__(self, other : 'Vector2dArray') -> 'Vector2dArray':
+        self._check_length(other)
+        return Vector2dArray(array(TYPECODE, map(add, self._xs, other._xs)),
+                             array(TYPECODE, map(add, self._ys, other._ys)))
+
+    def __sub__(self, other : 'Vector2dArray') -> 'Vector2dArray':
+        self._check_length(other)
+        return Vector2dArray(array(TYPECODE, map(sub, self._xs, other._xs)),
+                             array(TYPECODE, map(sub, self._ys, other._ys)))
+
+    def __mul__(self, value : int) -> 'Vector2dArray':
+        return Vector2dArray(array(TYPECODE, [x * value for x in self._xs]),
+                             array(TYPECODE, [y * value for y in self._ys]))
+
+    def __rmul__(self, value : int) -> 'Vector2dArray':
+        return self * value
+
+    def __floordiv__(self, value : int) -> 'Vector2dArray':
+        return Vector2dArray(array(TYPECODE, [x // value for x in self._xs]),
+                             array(TYPECODE, [y // value for y in self._ys]))
+
+    @staticmethod
+    def dot_product_static(v1 : 'Vector2dArray', v2 : 'Vector2dArray') -> array:
+        return v1.dot_product(v2)
+
+    def dot_product(self, other : 'Vector2dArray') -> array:
+        self._check_length(other)
+        return array(TYPECODE, map(add, map(mul, self._xs, other._xs), map(mul, self._ys, other._ys)))
+
+    @staticmethod
+    def cross_product_static(v1 : 'Vector2dArray', v2 : 'Vector2dArray') -> 'Vector2dArray':
+        return v1.cross_product(v2)
+
+    def cross_product(self, other : 'Vector2dArray') -> 'Vector2dArray':
+        self._check_length(other)
+        return Vector2dArray(self._cross_column(other), array(TYPECODE, [0]) * len(self._xs))
+
+    def _cross_column(self, other : 'Vector2dArray') -> array:
+        return array(TYPECODE, map(sub, map(mul, self._xs, other._ys), map(mul, self._ys, other._xs)))
+
+    @staticmethod
+    def triple_product_static(v1 : 'Vector2dArray', v2 : 'Vector2dArray', v3 : 'Vector2dArray') -> array:
+        return v1.triple_product(v2, v3)
+
+    def triple_product(self, v2 : 'Vector2dArray', v3 : 'Vector2dArray') -> array:
+        self._check_length(v2)
+        return array(TYPECODE, map(mul, self._xs, v2._cross_column(v3)))
@@ -0,0 +1,69 @@
+import random
+import time
+from Point2d import Point2d, WIDTH, HEIGHT
+from GridIndex import GridIndex, distance
+
+SIZES = (10_000, 100_000, 1_000_000)
+QUERIES = 5
+
+
+def random_point() -> Point2d:
+    return Point2d.unchecked(random.randint(0, WIDTH), random.randint(0, HEIGHT))
+
+
+def brute_rect(points : list[Point2d], bottom_left : Point2d, top_right : Point2d) -> list[Point2d]:
+    return [p for p in points if bottom_left.x <= p.x <= top_right.x and bottom_left.y <= p.y <= top_right.y]
+
+
+def brute_radius(points : list[Point2d], center : Point2d, radius : float) -> list[Point2d]:
+    return [p for p in points if distance(center, p) <= radius]
+
+
+def brute_nearest(points : list[Point2d], center : Point2d, k : int) -> list[Point2d]:
+    return sorted(points, key=lambda p: distance(center, p))[:k]
+
+
+def timed(func, *args) -> tuple[float, list]:
+    start = time.perf_counter()
+    result = func(*args)
+    return time.perf_counter() - start, result
+
+
+def main():
+    print(f"{'N':>10}{'запрос':>10}{'перебор, мс':>14}{'сетка, мс':>12}{'ускорение':>12}")
+    for size in SIZES:
+        points = [random_point() for _ in range(size)]
+        build_time, index = timed(GridIndex, points)
+        print(f"{size:>10}{'build':>10}{'-':>14}{build_time * 1000:>12.2f}{'-':>12}")
+
+        queries = []
+        for _ in range(QUERIES):
+            a, b = random_point(), random_point()
+            queries.append((Point2d.unchecked(min(a.x, b.x), min(a.y, b.y)),
+                            Point2d.unchecked(max(a.x, b.x), max(a.y, b.y)),
+                            random_point(), random.uniform(1, 10)))
+
+        for name in ("rect", "radius", "knn"):
+            brute_total = grid_total = 0.0
+            for bottom_left, top_right, center, radius in queries:
+                if name == "rect":
+                    brute_time, expected = timed(brute_rect, points, bottom_left, top_right)
+                    grid_time, actual = timed(index.query_rect, bottom_left, top_right)
+                    assert len(expected) == len(actual)
+                elif name == "radius":
+                    brute_time, expected = timed(brute_radius, points, center, radius)
+                    grid_time, actual = timed(index.query_radius, center, radius)
+                    assert len(expected) == len(actual)
+                else:
+                    brute_time, expected = timed(brute_nearest, points, center, 10)
+                    grid_time, actual = timed(index.nearest, center, 10)
+                    assert [distance(center, p) for p in expected] == [distance(center, p) for p in actual]
+                brute_total += brute_time
+                grid_total += grid_time
+            brute_ms = brute_total / QUERIES * 1000
+            grid_ms = grid_total / QUERIES * 1000
+            print(f"{size:>10}{name:>10}{brute_ms:>14.2f}{grid_ms:>12.2f}{brute_ms / grid_ms:>11.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,92 @@
+import random
+import timeit
+import tracemalloc
+from Point2d import Point2d, WIDTH, HEIGHT
+from Vector2d import Vector2d
+
+COUNT = 100_000
+
+
+class LegacyPoint2d:
+    def __init__(self, x : int, y : int) -> None:
+        self.x = x
+        self.y = y
+
+    @property
+    def x(self) -> int:
+        return self._x
+
+    @x.setter
+    def x(self, value: int) -> None:
+        if 0 <= value <= WIDTH:
+            self._x = value
+        else:
+            raise ValueError(f"x must be between 0 and {WIDTH}")
+
+    @property
+    def y(self) -> int:
+        return self._y
+
+    @y.setter
+    def y(self, value: int) -> None:
+        if 0 <= value <= HEIGHT:
+            self._y = value
+        else:
+            raise ValueError(f"y must be between 0 and {HEIGHT}")
+
+
+class LegacyVector2d:
+    def __init__(self, x : int, y : int) -> None:
+        self.x = x
+        self.y = y
+
+    @property
+    def x(self) -> int:
+        return self._x
+
+    @x.setter
+    def x(self, value: int) -> None:
+        self._x = value
+
+    @property
+    def y(self) -> int:
+        return self._y
+
+    @y.setter
+    def y(self, value: int) -> None:
+        self._y = value
+
+
+def measure_memory(factory, coords : list[tuple[int, int]]) -> float:
+    tracemalloc.start()
+    before = tracemalloc.take_snapshot()
+    objects = [factory(x, y) for x, y in coords]
+    after = tracemalloc.take_snapshot()
+    tracemalloc.stop()
+    total = sum(stat.size_diff for stat in after.compare_to(before, 'filename'))
+    return (total - objects.__sizeof__()) / len(objects)
+
+
+def measure_time(factory, coords : list[tuple[int, int]]) -> float:
+    return min(timeit.repeat(lambda: [factory(x, y) for x, y in coords], number=1, repeat=5)) / len(coords) * 1e9
+
+
+def main():
+    coords = [(random.randint(0, WIDTH), random.randint(0, HEIGHT)) for _ in range(COUNT)]
+
+    cases = [
+        ("Point2d (legacy, __dict__)", LegacyPoint2d),
+        ("Point2d (__slots__)", Point2d),
+        ("Point2d.unchecked", Point2d.unchecked),
+        ("Vector2d (legacy, __dict__)", LegacyVector2d),
+        ("Vector2d (__slots__)", Vector2d),
+        ("Vector2d.unchecked", Vector2d.unchecked),
+    ]
+
+    print(f"{'Вариант':<30}{'байт/объект':>14}{'нс/объект':>12}")
+    for name, factory in cases:
+        print(f"{name:<30}{measure_memory(factory, coords):>14.1f}{measure_time(factory, coords):>12.1f}")
+
+
+if __name__ == "__main__":
+    main()
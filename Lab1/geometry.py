@@ -0,0 +1,116 @@
+from typing import Sequence
+from Point2d import Point2d
+from Vector2dArray import Vector2dArray
+
+
+def _cross(o : Point2d, a : Point2d, b : Point2d) -> int:
+    return (a.x - o.x) * (b.y - o.y) - (a.y - o.y) * (b.x - o.x)
+
+
+def _positions(points : Sequence[Point2d]) -> Vector2dArray:
+    return Vector2dArray([p.x for p in points], [p.y for p in points])
+
+
+def orientations(origins : Sequence[Point2d], a : Sequence[Point2d], b : Sequence[Point2d]) -> list[int]:
+    cross = Vector2dArray.from_points(origins, a).cross_product(Vector2dArray.from_points(origins, b))
+    return [(value > 0) - (value < 0) for value in cross.xs]
+
+
+def convex_hull(points : Sequence[Point2d]) -> list[Point2d]:
+    unique = sorted({(p.x, p.y): p for p in points}.values(), key=lambda p: (p.x, p.y))
+    if len(unique) <= 2:
+        return unique
+
+    lower: list[Point2d] = []
+    for p in unique:
+        while len(lower) >= 2 and _cross(lower[-2], lower[-1], p) <= 0:
+            lower.pop()
+        lower.append(p)
+
+    upper: list[Point2d] = []
+    for p in reversed(unique):
+        while len(upper) >= 2 and _cross(upper[-2], upper[-1], p) <= 0:
+            upper.pop()
+        upper.append(p)
+
+    return lower[:-1] + upper[:-1]
+
+
+def doubled_signed_area(polygon : Sequence[Point2d]) -> int:
+    if len(polygon) < 3:
+        return 0
+    positions = _positions(polygon)
+    shifted = positions[1:]
+    shifted.xs.append(positions.xs[0])
+    shifted.ys.append(positions.ys[0])
+    return sum(positions.cross_product(shifted).xs)
+
+
+def signed_area(polygon : Sequence[Point2d]) -> float:
+    return doubled_signed_area(polygon) / 2
+
+
+def points_in_polygon(polygon : Sequence[Point2d], points : Sequence[Point2d]) -> list[bool]:
+    inside = [False] * len(points)
+    boundary = [False] * len(points)
+    xs = [p.x for p in points]
+    ys = [p.y for p in points]
+    count = len(polygon)
+    for i in range(count):
+        a = polygon[i]
+        b = polygon[(i + 1) % count]
+        ax, ay, bx, by = a.x, a.y, b.x, b.y
+        dx = bx - ax
+        dy = by - ay
+        x_min, x_max = min(ax, bx), max(ax, bx)
+        y_min, y_max = min(ay, by), max(ay, by)
+        for j in range(len(points)):
+            x, y = xs[j], ys[j]
+            cross = dx * (y - ay) - dy * (x - ax)
+            if cross == 0 and x_min <= x <= x_max and y_min <= y <= y_max:
+                boundary[j] = True
+            elif (ay > y) != (by > y) and (cross > 0) == (by > ay):
+                inside[j] = not inside[j]
+    return [i or b for i, b in zip(inside, boundary)]
+
+
+def point_in_polygon(polygon : Sequence[Point2d], point : Point2d) -> bool:
+    return points_in_polygon(polygon, [point])[0]
+
+
+def _on_segment(p : Point2d, q : Point2d, r : Point2d) -> bool:
+    return min(p.x, q.x) <= r.x <= max(p.x, q.x) and min(p.y, q.y) <= r.y <= max(p.y, q.y)
+
+
+def segments_intersect(p1 : Point2d, p2 : Point2d, q1 : Point2d, q2 : Point2d) -> bool:
+    d1 = _cross(q1, q2, p1)
+    d2 = _cross(q1, q2, p2)
+    d3 = _cross(p1, p2, q1)
+    d4 = _cross(p1, p2, q2)
+    if ((d1 > 0 and d2 < 0) or (d1 < 0 and d2 > 0)) and ((d3 > 0 and d4 < 0) or (d3 < 0 and d4 > 0)):
+        return True
+    return ((d1 == 0 and _on_segment(q1, q2, p1)) or
+            (d2 == 0 and _on_segment(q1, q2, p2)) or
+            (d3 == 0 and _on_segment(p1, p2, q1)) or
+            (d4 == 0 and _on_segment(p1, p2, q2)))
+
+
+def segment_intersections(starts : Sequence[Point2d], ends : Sequence[Point2d]) -> list[tuple[int, int]]:
+    if len(starts) != len(ends):
+        raise ValueError("starts and ends must have the same length")
+    order = sorted(range(len(starts)), key=lambda i: min(starts[i].x, ends[i].x))
+    active: list[int] = []
+    result = []
+    for i in order:
+        s, e = starts[i], ends[i]
+        x_min = min(s.x, e.x)
+        y_min, y_max = min(s.y, e.y), max(s.y, e.y)
+        active = [j for j in active if max(starts[j].x, ends[j].x) >= x_min]
+        for j in active:
+            if max(starts[j].y, ends[j].y) < y_min or min(starts[j].y, ends[j].y) > y_max:
+                continue
+            if segments_intersect(starts[j], ends[j], s, e):
+                result.append((min(i, j), max(i, j)))
+        active.append(i)
+    result.sort()
+    return result
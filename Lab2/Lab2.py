@@ -1,5 +1,10 @@
+import sys
 from enum import Enum
 from typing import Self
+from frame_buffer import FrameBuffer, KEEP
+from glyph_cache import GlyphCache, CachedGlyph
+from fonts import Font, FontRegistry
+from layout import Align, TextBlock, break_lines, align_row
 
 
 class Color(Enum):
@@ -22,29 +27,39 @@ class Color(Enum):
 
 
 class Printer:
-    _font: dict[str, list[str]] = {}
-    _size: tuple[int, int] = (0, 0)
+    _font: Font | None = None
+    _registry: FontRegistry = FontRegistry()
+    _target: FrameBuffer | None = None
+    _glyph_cache: GlyphCache = GlyphCache()
 
-    @staticmethod
-    def init() -> None:
+    @classmethod
+    def init(cls) -> None:
+        if cls._target is not None:
+            cls._target.clear()
+            cls._target.invalidate()
+            return
         print("\033[2J\033[1;1H", end="")
 
     @classmethod
-    def load_font(cls, filename: str) -> None:
-        with open(file=filename) as f:
-            font_file = f.readlines()
-
-        size_parts = font_file[0][:-1].split(sep='x')
-        if len(size_parts) != 2:
-            raise ValueError(f"Некорректный формат размера в файле: {size_parts}")
+    def set_target(cls, target: FrameBuffer | None) -> None:
+        cls._target = target
 
-        cls._size = (int(size_parts[0]), int(size_parts[1]))
+    @classmethod
+    def load_font(cls, filename: str, name: str | None = None) -> Font:
+        font = cls._registry.register(filename, name)
+        cls._font = font
+        return font
 
-        if (len(font_file) - 1) % (cls._size[0] + 1) != 0:
-            raise ValueError(f"Некорректный размер файла")
+    @classmethod
+    def get_font(cls, name: str) -> Font:
+        return cls._registry.get(name)
 
-        for char in range(1, len(font_file), cls._size[0] + 1):
-            cls._font[font_file[char][:-1]] = [font_file[i][:-1] for i in range(char + 1, char + cls._size[0] + 1)]
+    @classmethod
+    def _resolve_font(cls, font: Font | None) -> Font:
+        font = font if font is not None else cls._font
+        if font is None:
+            raise ValueError("Шрифт не загружен. Сначала вызовите Printer.load_font()")
+        return font
 
     @classmethod
     def _get_escape_code(cls, color: Color, background: bool = False) -> str:
@@ -53,6 +68,67 @@ class Printer:
         code = color.value + (10 if background else 0)
         return f"\033[{code}m"
 
+    @classmethod
+    def _get_sgr_code(cls, color: Color, background: bool = False) -> int:
+        if color == Color.TRANSPARENT:
+            return KEEP
+        return color.value + (10 if background else 0)
+
+    @classmethod
+    def _get_glyph(cls, font: Font, char: str, symbol: str, color: Color, background_color: Color) -> CachedGlyph:
+        key = (font, char, symbol, color, background_color)
+        glyph = cls._glyph_cache.get(key)
+        if glyph is not None:
+            return glyph
+
+        if char not in font:
+            raise ValueError(f"Символ {char} отсутствует в шрифте.")
+
+        prefix = cls._get_escape_code(color) + cls._get_escape_code(background_color, background=True)
+        suffix = "\033[0m" if prefix else ""
+        rows = tuple(line.replace('*', symbol) for line in font[char])
+        glyph = CachedGlyph(rows, tuple(f"{prefix}{row}{suffix}".encode() for row in rows))
+        cls._glyph_cache.put(key, glyph)
+        return glyph
+
+    @staticmethod
+    def _write(data: bytes) -> None:
+        stream = sys.stdout
+        buffer = getattr(stream, 'buffer', None)
+        if buffer is None:
+            stream.write(data.decode())
+            stream.flush()
+            return
+        stream.flush()
+        buffer.write(data)
+        buffer.flush()
+
+    @classmethod
+    def _render(cls, font: Font, text: str, position: tuple[int, int], symbol: str,
+                color: Color, background_color: Color) -> int:
+        x, y = position
+        advance = font.size[0]
+        glyphs = [cls._get_glyph(font, char, symbol, color, background_color) for char in text]
+
+        if cls._target is not None:
+            fg = cls._get_sgr_code(color)
+            bg = cls._get_sgr_code(background_color, background=True)
+            for glyph in glyphs:
+                for dy, row in enumerate(glyph.rows):
+                    cls._target.put_text(x, y + dy, row, fg, bg)
+                x += advance
+            return x
+
+        parts = []
+        for glyph in glyphs:
+            for dy, row in enumerate(glyph.encoded):
+                parts.append(f"\033[{y + dy + 1};{x + 1}H".encode())
+                parts.append(row)
+            x += advance
+        parts.append(b"\n")
+        cls._write(b"".join(parts))
+        return x
+
     @classmethod
     def print_(
             cls,
@@ -60,40 +136,66 @@ class Printer:
             color: Color = Color.DEFAULT,
             position: tuple[int, int] = (0, 0),
             symbol: str = '*',
-            background_color: Color = Color.TRANSPARENT
+            background_color: Color = Color.TRANSPARENT,
+            font: Font | None = None
     ) -> None:
-        if not cls._font:
-            raise ValueError("Шрифт не загружен. Сначала вызовите Printer.load_font()")
-
-        x, y = position
-        fg_code = cls._get_escape_code(color)
-        bg_code = cls._get_escape_code(background_color, background=True)
-        reset_code = "\033[0m"
+        cls._render(cls._resolve_font(font), text, position, symbol, color, background_color)
 
-        for char in text:
-            if char not in cls._font:
-                raise ValueError(f"Символ {char} отсутствует в шрифте.")
-
-            char_lines = cls._font[char]
-            for dy, line in enumerate(char_lines):
-                rendered = line.replace('*', symbol)
-                print(
-                    f"\033[{y + dy + 1};{x + 1}H"
-                    f"{fg_code}{bg_code}{rendered}{reset_code}",
-                    end=""
-                )
-
-            x += cls._size[0]
+    @classmethod
+    def layout(
+            cls,
+            text: str,
+            max_width: int,
+            align: Align = Align.LEFT,
+            symbol: str = '*',
+            font: Font | None = None,
+            line_spacing: int = 1
+    ) -> TextBlock:
+        font = cls._resolve_font(font)
+        advance, height = font.size
+        blank = " " * max_width
+        rows = []
+        for i, line in enumerate(break_lines(text, max_width // advance)):
+            if i:
+                rows.extend([blank] * line_spacing)
+            glyphs = [cls._get_glyph(font, char, symbol, Color.TRANSPARENT, Color.TRANSPARENT).rows
+                      for char in line]
+            for dy in range(height):
+                rows.append(align_row("".join(glyph[dy] for glyph in glyphs), max_width, align))
+        return TextBlock(tuple(rows), max_width)
 
-        print(flush=True)
+    @classmethod
+    def print_block(
+            cls,
+            block: TextBlock,
+            color: Color = Color.DEFAULT,
+            position: tuple[int, int] = (0, 0),
+            background_color: Color = Color.TRANSPARENT
+    ) -> None:
+        x, y = position
+        if cls._target is not None:
+            fg = cls._get_sgr_code(color)
+            bg = cls._get_sgr_code(background_color, background=True)
+            for dy, row in enumerate(block.rows):
+                cls._target.put_text(x, y + dy, row, fg, bg)
+            return
+
+        prefix = cls._get_escape_code(color) + cls._get_escape_code(background_color, background=True)
+        parts = [prefix]
+        for dy, row in enumerate(block.rows):
+            parts.append(f"\033[{y + dy + 1};{x + 1}H{row}")
+        parts.append("\033[0m\n")
+        cls._write("".join(parts).encode())
 
     def __init__(
             self,
             color: Color,
             position: tuple[int, int],
             symbol: str = '*',
-            background_color: Color = Color.TRANSPARENT
+            background_color: Color = Color.TRANSPARENT,
+            font: Font | None = None
     ) -> None:
+        self.font = font
         self.color = color
         self.background_color = background_color
         self.symbol = symbol
@@ -101,32 +203,26 @@ class Printer:
         self.current_x, self.current_y = position
 
     def __enter__(self) -> Self:
+        if self._target is not None:
+            return self
         fg_code = self._get_escape_code(self.color)
         bg_code = self._get_escape_code(self.background_color, background=True)
         print(f"{fg_code}{bg_code}", end="")
         return self
 
     def __exit__(self, *args) -> None:
+        if self._target is not None:
+            return
         print("\033[0m", end="", flush=True)
 
     def print(self, text: str) -> None:
-        if not self._font:
-            raise ValueError("Шрифт не загружен. Сначала вызовите Printer.load_font()")
-
-        x, y = self.current_x, self.current_y
-        for char in text:
-            if char not in self._font:
-                raise ValueError(f"Символ {char} отсутствует в шрифте.")
-
-            char_lines = self._font[char]
-            for dy, line in enumerate(char_lines):
-                rendered = line.replace('*', self.symbol)
-                print(f"\033[{y + dy + 1};{x + 1}H{rendered}", end="")
-
-            x += self._size[0]
-
-        self.current_x = x
-        print(flush=True)
+        font = self._resolve_font(self.font)
+        if self._target is not None:
+            color, background_color = self.color, self.background_color
+        else:
+            color, background_color = Color.TRANSPARENT, Color.TRANSPARENT
+        self.current_x = self._render(font, text, (self.current_x, self.current_y), self.symbol,
+                                      color, background_color)
 
 
 def main():
@@ -139,5 +235,8 @@ def main():
     with Printer(position =(2, 7), symbol= "<", color= Color.MAGENTA) as printer:
         printer.print("RESOLUTION")
 
+    block = Printer.layout("HELLO WORLD", max_width=60, align=Align.CENTER, symbol='#')
+    Printer.print_block(block, Color.CYAN, position=(0, 16))
+
 if __name__ == '__main__':
     main()
\ No newline at end of file
@@ -0,0 +1,55 @@
+import io
+import sys
+import time
+from Lab2 import Printer, Color
+
+TEXT = "THE QUICK BROWN FOX JUMPS OVER THE LAZY DOG " * 4
+REPEAT = 500
+
+
+def legacy_print_(text: str, color: Color, position: tuple[int, int], symbol: str, background_color: Color) -> None:
+    x, y = position
+    fg_code = Printer._get_escape_code(color)
+    bg_code = Printer._get_escape_code(background_color, background=True)
+    reset_code = "\033[0m"
+
+    for char in text:
+        char_lines = Printer._font[char]
+        for dy, line in enumerate(char_lines):
+            rendered = line.replace('*', symbol)
+            print(
+                f"\033[{y + dy + 1};{x + 1}H"
+                f"{fg_code}{bg_code}{rendered}{reset_code}",
+                end=""
+            )
+
+        x += Printer._font.size[0]
+
+    print(flush=True)
+
+
+def measure(func) -> float:
+    stdout = sys.stdout
+    sys.stdout = io.TextIOWrapper(io.BytesIO(), encoding='utf-8')
+    try:
+        start = time.perf_counter()
+        for _ in range(REPEAT):
+            func(TEXT, Color.GREEN, (0, 0), '#', Color.BLACK)
+        return time.perf_counter() - start
+    finally:
+        sys.stdout = stdout
+
+
+def main():
+    print(f"{'шрифт':<12}{'без кэша, с':>14}{'с кэшем, с':>14}{'ускорение':>12}{'hits':>10}{'misses':>8}")
+    for font in ("font5.txt", "font7.txt"):
+        Printer.load_font(font)
+        Printer._glyph_cache.clear()
+        legacy = measure(legacy_print_)
+        cached = measure(Printer.print_)
+        print(f"{font:<12}{legacy:>14.3f}{cached:>14.3f}{legacy / cached:>11.1f}x"
+              f"{Printer._glyph_cache.hits:>10}{Printer._glyph_cache.misses:>8}")
+
+
+if __name__ == '__main__':
+    main()
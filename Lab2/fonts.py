@@ -0,0 +1,195 @@
+import hashlib
+import mmap
+import os
+import struct
+import tempfile
+from typing import Iterator
+
+MAGIC = b"BFNT"
+VERSION = 1
+HEADER = struct.Struct('<4sBBBH')
+ENTRY = struct.Struct('<II')
+BINARY_SUFFIX = ".bfnt"
+CACHE_DIRECTORY = os.path.join(tempfile.gettempdir(), "lab2-fonts")
+
+
+def parse_font_text(filename: str) -> tuple[tuple[int, int], dict[str, list[str]]]:
+    with open(file=filename) as f:
+        font_file = f.read().split('\n')
+
+    size_parts = font_file[0].split(sep='x')
+    if len(size_parts) != 2:
+        raise ValueError(f"Некорректный формат размера в файле: {size_parts}")
+
+    size = (int(size_parts[0]), int(size_parts[1]))
+    if font_file[-1] == "":
+        font_file.pop()
+
+    if (len(font_file) - 1) % (size[1] + 1) != 0:
+        raise ValueError(f"Некорректный размер файла")
+
+    glyphs = {}
+    for char in range(1, len(font_file), size[1] + 1):
+        glyphs[font_file[char]] = [font_file[i].ljust(size[0]) for i in range(char + 1, char + size[1] + 1)]
+    return size, glyphs
+
+
+def build_font(source: str) -> bytes:
+    (width, height), glyphs = parse_font_text(source)
+    row_bytes = (width + 7) // 8
+    data_offset = HEADER.size + ENTRY.size * len(glyphs)
+
+    index = bytearray()
+    data = bytearray()
+    for char, lines in glyphs.items():
+        if len(char) != 1:
+            raise ValueError(f"Некорректный символ в шрифте: {char!r}")
+        index += ENTRY.pack(ord(char), data_offset + len(data))
+        for line in lines:
+            bits = 0
+            for column, pixel in enumerate(line[:width]):
+                if pixel == '*':
+                    bits |= 1 << column
+            data += bits.to_bytes(row_bytes, 'little')
+
+    return HEADER.pack(MAGIC, VERSION, width, height, len(glyphs)) + bytes(index) + bytes(data)
+
+
+def compile_font(source: str, destination: str) -> None:
+    font = build_font(source)
+    temp = destination + ".tmp"
+    with open(temp, 'wb') as f:
+        f.write(font)
+    os.replace(temp, destination)
+
+
+class Font:
+    def __init__(self, path: str, name: str | None = None) -> None:
+        self.path = path
+        self.name = name if name is not None else path
+        self._size: tuple[int, int] | None = None
+        self._map: mmap.mmap | None = None
+        self._offsets: dict[str, int] = {}
+        self._rows: dict[str, list[str]] = {}
+
+    def _binary_candidates(self) -> list[str]:
+        source = os.path.abspath(self.path)
+        key = hashlib.sha1(source.encode('utf-8')).hexdigest()[:12]
+        name = os.path.splitext(os.path.basename(source))[0]
+        return [os.path.splitext(self.path)[0] + BINARY_SUFFIX,
+                os.path.join(CACHE_DIRECTORY, f"{name}-{key}{BINARY_SUFFIX}")]
+
+    def _binary_path(self) -> str | None:
+        if self.path.endswith(BINARY_SUFFIX):
+            return self.path
+        modified = os.path.getmtime(self.path)
+        for binary in self._binary_candidates():
+            try:
+                if not os.path.exists(binary) or os.path.getmtime(binary) < modified:
+                    os.makedirs(os.path.dirname(binary) or ".", exist_ok=True)
+                    compile_font(self.path, binary)
+                return binary
+            except OSError:
+                continue
+        return None
+
+    def _load(self) -> None:
+        binary = self._binary_path()
+        if binary is None:
+            font = build_font(self.path)
+            self._map = mmap.mmap(-1, len(font))
+            self._map.write(font)
+        else:
+            with open(binary, 'rb') as f:
+                self._map = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+
+        magic, version, width, height, count = HEADER.unpack_from(self._map, 0)
+        if magic != MAGIC or version != VERSION:
+            raise ValueError(f"Некорректный формат шрифта: {self.path}")
+
+        self._size = (width, height)
+        self._offsets = {
+            chr(code): offset
+            for code, offset in ENTRY.iter_unpack(self._map[HEADER.size:HEADER.size + ENTRY.size * count])
+        }
+
+    @property
+    def is_loaded(self) -> bool:
+        return self._map is not None
+
+    @property
+    def size(self) -> tuple[int, int]:
+        if self._map is None:
+            self._load()
+        return self._size
+
+    def __contains__(self, char: str) -> bool:
+        if self._map is None:
+            self._load()
+        return char in self._offsets
+
+    def __len__(self) -> int:
+        if self._map is None:
+            self._load()
+        return len(self._offsets)
+
+    def __getitem__(self, char: str) -> list[str]:
+        rows = self._rows.get(char)
+        if rows is not None:
+            return rows
+
+        if self._map is None:
+            self._load()
+        if char not in self._offsets:
+            raise KeyError(char)
+
+        width, height = self._size
+        row_bytes = (width + 7) // 8
+        offset = self._offsets[char]
+        rows = []
+        for row in range(height):
+            start = offset + row * row_bytes
+            bits = int.from_bytes(self._map[start:start + row_bytes], 'little')
+            rows.append("".join('*' if bits >> column & 1 else ' ' for column in range(width)))
+        self._rows[char] = rows
+        return rows
+
+    def close(self) -> None:
+        if self._map is not None:
+            self._map.close()
+            self._map = None
+        self._rows.clear()
+
+    def __repr__(self) -> str:
+        return f"Font(name = {self.name!r}, path = {self.path!r})"
+
+
+class FontRegistry:
+    def __init__(self) -> None:
+        self._fonts: dict[str, Font] = {}
+
+    def register(self, path: str, name: str | None = None) -> Font:
+        name = name if name is not None else path
+        font = self._fonts.get(name)
+        if font is None or font.path != path:
+            if font is not None:
+                font.close()
+            font = Font(path, name)
+            self._fonts[name] = font
+        return font
+
+    def get(self, name: str) -> Font:
+        if name not in self._fonts:
+            raise ValueError(f"Шрифт {name} не зарегистрирован")
+        return self._fonts[name]
+
+    def unregister(self, name: str) -> None:
+        font = self._fonts.pop(name, None)
+        if font is not None:
+            font.close()
+
+    def __contains__(self, name: str) -> bool:
+        return name in self._fonts
+
+    def __iter__(self) -> Iterator[Font]:
+        return iter(self._fonts.values())
@@ -0,0 +1,105 @@
+import sys
+from typing import TextIO
+
+DEFAULT_FG = 39
+DEFAULT_BG = 49
+KEEP = 0
+
+
+class FrameBuffer:
+    def __init__(self, width: int, height: int, stream: TextIO | None = None, gap: int = 4) -> None:
+        if width <= 0 or height <= 0:
+            raise ValueError("Размер буфера должен быть положительным")
+        self.width = width
+        self.height = height
+        self.stream = stream
+        self.gap = gap
+        self._chars = [' '] * (width * height)
+        self._fg = [DEFAULT_FG] * (width * height)
+        self._bg = [DEFAULT_BG] * (width * height)
+        self._front: tuple[list[str], list[int], list[int]] | None = None
+
+    def clear(self) -> None:
+        size = self.width * self.height
+        self._chars = [' '] * size
+        self._fg = [DEFAULT_FG] * size
+        self._bg = [DEFAULT_BG] * size
+
+    def invalidate(self) -> None:
+        self._front = None
+
+    def put_text(self, x: int, y: int, text: str, fg: int = KEEP, bg: int = KEEP) -> None:
+        if not 0 <= y < self.height or x >= self.width:
+            return
+        if x < 0:
+            text = text[-x:]
+            x = 0
+        text = text[:self.width - x]
+        if not text:
+            return
+        start = y * self.width + x
+        end = start + len(text)
+        self._chars[start:end] = text
+        if fg != KEEP:
+            self._fg[start:end] = [fg] * len(text)
+        if bg != KEEP:
+            self._bg[start:end] = [bg] * len(text)
+
+    def get_cell(self, x: int, y: int) -> tuple[str, int, int]:
+        if not (0 <= x < self.width and 0 <= y < self.height):
+            raise IndexError("FrameBuffer: координаты вне буфера")
+        i = y * self.width + x
+        return self._chars[i], self._fg[i], self._bg[i]
+
+    def _changed_runs(self, row: int) -> list[tuple[int, int]]:
+        start = row * self.width
+        end = start + self.width
+        chars, fg, bg = self._chars, self._fg, self._bg
+        if self._front is None:
+            return [(start, end)]
+        front_chars, front_fg, front_bg = self._front
+        if chars[start:end] == front_chars[start:end] and fg[start:end] == front_fg[start:end] \
+                and bg[start:end] == front_bg[start:end]:
+            return []
+
+        runs: list[tuple[int, int]] = []
+        i = start
+        while i < end:
+            if chars[i] == front_chars[i] and fg[i] == front_fg[i] and bg[i] == front_bg[i]:
+                i += 1
+                continue
+            run_start = i
+            while i < end and not (chars[i] == front_chars[i] and fg[i] == front_fg[i] and bg[i] == front_bg[i]):
+                i += 1
+            if runs and run_start - runs[-1][1] <= self.gap:
+                runs[-1] = (runs[-1][0], i)
+            else:
+                runs.append((run_start, i))
+        return runs
+
+    def compose(self) -> str:
+        parts: list[str] = []
+        pen: tuple[int, int] | None = None
+        chars, fg, bg = self._chars, self._fg, self._bg
+        for row in range(self.height):
+            for run_start, run_end in self._changed_runs(row):
+                column = run_start - row * self.width
+                parts.append(f"\033[{row + 1};{column + 1}H")
+                for i in range(run_start, run_end):
+                    style = (fg[i], bg[i])
+                    if style != pen:
+                        parts.append(f"\033[{style[0]};{style[1]}m")
+                        pen = style
+                    parts.append(chars[i])
+        if pen is not None:
+            parts.append("\033[0m")
+        return "".join(parts)
+
+    def present(self) -> int:
+        frame = self.compose()
+        self._front = (self._chars.copy(), self._fg.copy(), self._bg.copy())
+        if frame:
+            stream = self.stream if self.stream is not None else sys.stdout
+            stream.write(frame)
+            stream.flush()
+        return len(frame)
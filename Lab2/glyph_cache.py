@@ -0,0 +1,45 @@
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Hashable
+
+
+@dataclass(frozen=True, slots=True)
+class CachedGlyph:
+    rows: tuple[str, ...]
+    encoded: tuple[bytes, ...]
+
+
+class GlyphCache:
+    def __init__(self, maxsize: int = 1024) -> None:
+        if maxsize <= 0:
+            raise ValueError("Размер кэша должен быть положительным")
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self._glyphs: OrderedDict[Hashable, CachedGlyph] = OrderedDict()
+
+    def get(self, key: Hashable) -> CachedGlyph | None:
+        glyph = self._glyphs.get(key)
+        if glyph is None:
+            self.misses += 1
+            return None
+        self.hits += 1
+        self._glyphs.move_to_end(key)
+        return glyph
+
+    def put(self, key: Hashable, glyph: CachedGlyph) -> None:
+        self._glyphs[key] = glyph
+        self._glyphs.move_to_end(key)
+        if len(self._glyphs) > self.maxsize:
+            self._glyphs.popitem(last=False)
+
+    def clear(self) -> None:
+        self._glyphs.clear()
+        self.hits = 0
+        self.misses = 0
+
+    def __len__(self) -> int:
+        return len(self._glyphs)
+
+    def __contains__(self, key: Hashable) -> bool:
+        return key in self._glyphs
@@ -0,0 +1,62 @@
+from dataclasses import dataclass
+from enum import Enum
+from typing import TextIO
+
+
+class Align(Enum):
+    LEFT = "left"
+    CENTER = "center"
+    RIGHT = "right"
+
+
+@dataclass(frozen=True, slots=True)
+class TextBlock:
+    rows: tuple[str, ...]
+    width: int
+
+    @property
+    def height(self) -> int:
+        return len(self.rows)
+
+    def write_to(self, stream: TextIO) -> None:
+        stream.write("\n".join(self.rows) + "\n")
+
+    def __str__(self) -> str:
+        return "\n".join(self.rows)
+
+
+def break_lines(text: str, max_chars: int) -> list[str]:
+    if max_chars <= 0:
+        raise ValueError("Ширина меньше ширины одного символа")
+
+    lines = []
+    for paragraph in text.split('\n'):
+        line = ""
+        for word in paragraph.split():
+            while len(word) > max_chars:
+                if line:
+                    lines.append(line)
+                    line = ""
+                lines.append(word[:max_chars])
+                word = word[max_chars:]
+            if not word:
+                continue
+            if not line:
+                line = word
+            elif len(line) + 1 + len(word) <= max_chars:
+                line = f"{line} {word}"
+            else:
+                lines.append(line)
+                line = word
+        lines.append(line)
+    return lines
+
+
+def align_row(row: str, width: int, align: Align) -> str:
+    match align:
+        case Align.LEFT:
+            return row.ljust(width)
+        case Align.RIGHT:
+            return row.rjust(width)
+        case Align.CENTER:
+            return (" " * ((width - len(row)) // 2) + row).ljust(width)
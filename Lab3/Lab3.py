@@ -1,16 +1,107 @@
-import datetime, re
-from typing import List, Protocol
+import atexit, datetime, errno, os, re, socket, threading, time
+from enum import Enum, IntEnum
+from typing import Any, List, Protocol
+
+
+class LogLevel(IntEnum):
+    DEBUG = 10
+    INFO = 20
+    WARNING = 30
+    ERROR = 40
+
+
+class LogRecord:
+    __slots__ = ('timestamp', 'level', 'template', 'args', 'fields', '_message', '_text')
+
+    def __init__(self, template: str, args: tuple = (), level: LogLevel | None = None,
+                 fields: dict[str, Any] | None = None, timestamp: float | None = None) -> None:
+        self.timestamp = timestamp if timestamp is not None else time.time()
+        self.level = level
+        self.template = template
+        self.args = args
+        self.fields = fields if fields is not None else {}
+        self._message: str | None = None
+        self._text: str | None = None
+
+    @classmethod
+    def rendered(cls, text: str, timestamp: float | None = None) -> 'LogRecord':
+        record = cls(text, timestamp=timestamp)
+        record._message = text
+        record._text = text
+        return record
+
+    def detached(self) -> 'LogRecord':
+        record = LogRecord(self.template, (), self.level, None, self.timestamp)
+        record._message = self.message
+        record._text = self._text
+        return record
+
+    @property
+    def message(self) -> str:
+        if self._message is None:
+            message = self.template
+            if self.args or self.fields:
+                try:
+                    message = self.template.format(*self.args, **self.fields)
+                except (KeyError, IndexError, ValueError):
+                    pass
+            self._message = message if self.level is None else f"{self.level.name}: {message}"
+        return self._message
+
+    @property
+    def text(self) -> str:
+        if self._text is None:
+            self._text = f"[{datetime.datetime.fromtimestamp(self.timestamp)}]: {self.message}"
+        return self._text
+
+    def __getstate__(self) -> tuple:
+        return self.timestamp, self.level, self.template, self.args, self.fields, self._message, self._text
+
+    def __setstate__(self, state: tuple) -> None:
+        self.timestamp, self.level, self.template, self.args, self.fields, self._message, self._text = state
 
 
 class LogFilterProtocol(Protocol):
     def match(self, text: str) -> bool:
         pass
 
+    def match_record(self, record: LogRecord) -> bool:
+        return self.match(record.message)
+
 
 class LogHandlerProtocol(Protocol):
     def handle(self, text: str) -> None:
         pass
 
+    def handle_batch(self, texts: List[str]) -> None:
+        for text in texts:
+            self.handle(text)
+
+    def handle_record(self, record: LogRecord) -> None:
+        self.handle(record.text)
+
+    def handle_records(self, records: List[LogRecord]) -> None:
+        self.handle_batch([record.text for record in records])
+
+
+class FlushTimer:
+    def __init__(self, interval: float | None, callback) -> None:
+        self.interval = interval
+        self.callback = callback
+        self._timer: threading.Timer | None = None
+
+    def schedule(self) -> None:
+        if self.interval is None or self._timer is not None:
+            return
+        self._timer = threading.Timer(self.interval, self.callback)
+        self._timer.daemon = True
+        self._timer.start()
+
+    def cancel(self) -> None:
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+
 
 class SimpleLogFilter(LogFilterProtocol):
     def __init__(self, pattern: str) -> None:
@@ -28,10 +119,72 @@ class ReLogFilter(LogFilterProtocol):
         return bool(self.regex.search(text))
 
 
+class AndLogFilter(LogFilterProtocol):
+    def __init__(self, *filters: LogFilterProtocol) -> None:
+        self.filters = list(filters)
+
+    def match(self, text: str) -> bool:
+        return all(log_filter.match(text) for log_filter in self.filters)
+
+    def match_record(self, record: LogRecord) -> bool:
+        return all(log_filter.match_record(record) for log_filter in self.filters)
+
+
+class OrLogFilter(LogFilterProtocol):
+    def __init__(self, *filters: LogFilterProtocol) -> None:
+        self.filters = list(filters)
+
+    def match(self, text: str) -> bool:
+        return any(log_filter.match(text) for log_filter in self.filters)
+
+    def match_record(self, record: LogRecord) -> bool:
+        return any(log_filter.match_record(record) for log_filter in self.filters)
+
+
+class NotLogFilter(LogFilterProtocol):
+    def __init__(self, log_filter: LogFilterProtocol) -> None:
+        self.filter = log_filter
+
+    def match(self, text: str) -> bool:
+        return not self.filter.match(text)
+
+    def match_record(self, record: LogRecord) -> bool:
+        return not self.filter.match_record(record)
+
+
+class LevelLogFilter(LogFilterProtocol):
+    def __init__(self, min_level: LogLevel) -> None:
+        self.min_level = min_level
+
+    def match(self, text: str) -> bool:
+        name = text.split(':', 1)[0].strip()
+        return name in LogLevel.__members__ and LogLevel[name] >= self.min_level
+
+    def match_record(self, record: LogRecord) -> bool:
+        if record.level is None:
+            return self.match(record.template)
+        return record.level >= self.min_level
+
+
+class FieldLogFilter(LogFilterProtocol):
+    def __init__(self, name: str, value: Any) -> None:
+        self.name = name
+        self.value = value
+
+    def match(self, text: str) -> bool:
+        return False
+
+    def match_record(self, record: LogRecord) -> bool:
+        return self.name in record.fields and record.fields[self.name] == self.value
+
+
 class ConsoleHandler(LogHandlerProtocol):
     def handle(self, text: str) -> None:
         print(f"[CONSOLE] {text}")
 
+    def handle_batch(self, texts: List[str]) -> None:
+        print("\n".join(f"[CONSOLE] {text}" for text in texts))
+
 
 class FileHandler(LogHandlerProtocol):
     def __init__(self, file_path: str) -> None:
@@ -41,15 +194,244 @@ class FileHandler(LogHandlerProtocol):
         with open(self.file_path, 'a', encoding='utf-8') as file:
             file.write(f"{text}\n")
 
+    def handle_batch(self, texts: List[str]) -> None:
+        with open(self.file_path, 'a', encoding='utf-8') as file:
+            file.write("".join(f"{text}\n" for text in texts))
+
+
+class SocketTransport(Enum):
+    TCP = "tcp"
+    UDP = "udp"
+    UNIX = "unix"
+
 
 class SocketHandler(LogHandlerProtocol):
+    def __init__(self,
+                 address: tuple[str, int] | str = ("localhost", 9020),
+                 transport: SocketTransport = SocketTransport.TCP,
+                 batch_size: int = 100,
+                 flush_interval: float | None = 1.0,
+                 timeout: float = 1.0,
+                 retry_interval: float = 1.0,
+                 spool_path: str | None = None,
+                 max_datagram: int = 8192) -> None:
+        self.address = address
+        self.transport = transport
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self.timeout = timeout
+        self.retry_interval = retry_interval
+        self.spool_path = spool_path
+        self.max_datagram = max_datagram
+        self.dropped = 0
+        self._buffer: List[bytes] = []
+        self._socket: socket.socket | None = None
+        self._retry_at = 0.0
+        self._lock = threading.RLock()
+        self._flush_timer = FlushTimer(flush_interval, self.flush)
+        atexit.register(self.close)
+
+    def _open_socket(self) -> socket.socket:
+        match self.transport:
+            case SocketTransport.TCP:
+                return socket.create_connection(self.address, self.timeout)
+            case SocketTransport.UDP:
+                sock = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+            case SocketTransport.UNIX:
+                sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        try:
+            sock.settimeout(self.timeout)
+            sock.connect(self.address)
+        except OSError:
+            sock.close()
+            raise
+        return sock
+
+    def _connect(self) -> bool:
+        if self._socket is not None:
+            return True
+        if time.monotonic() < self._retry_at:
+            return False
+        try:
+            self._socket = self._open_socket()
+        except OSError:
+            self._retry_at = time.monotonic() + self.retry_interval
+            return False
+        self._replay_spool()
+        return self._socket is not None
+
+    def _disconnect(self) -> None:
+        if self._socket is not None:
+            self._socket.close()
+            self._socket = None
+        self._retry_at = time.monotonic() + self.retry_interval
+
+    def _datagrams(self, lines: List[bytes]) -> List[bytes]:
+        datagrams = []
+        current: List[bytes] = []
+        size = 0
+        for line in lines:
+            if current and size + len(line) > self.max_datagram:
+                datagrams.append(b"".join(current))
+                current, size = [], 0
+            current.append(line)
+            size += len(line)
+        if current:
+            datagrams.append(b"".join(current))
+        return datagrams
+
+    def _write(self, lines: List[bytes]) -> bool:
+        try:
+            if self.transport == SocketTransport.UDP:
+                for datagram in self._datagrams(lines):
+                    self._socket.send(datagram)
+            else:
+                self._socket.sendall(b"".join(lines))
+        except OSError:
+            self._disconnect()
+            return False
+        return True
+
+    def _spool(self, lines: List[bytes]) -> None:
+        if self.spool_path is None:
+            self.dropped += len(lines)
+            return
+        with open(self.spool_path, 'ab') as file:
+            file.write(b"".join(lines))
+
+    def _replay_spool(self) -> None:
+        if self.spool_path is None or not os.path.exists(self.spool_path):
+            return
+        with open(self.spool_path, 'rb') as file:
+            lines = file.read().splitlines(keepends=True)
+        if not lines or self._write(lines):
+            os.remove(self.spool_path)
+
     def handle(self, text: str) -> None:
-        print(f"[SOCKET] Sending message: {text}")
+        with self._lock:
+            self._buffer.append(f"{text}\n".encode('utf-8'))
+            if len(self._buffer) >= self.batch_size:
+                self.flush()
+            else:
+                self._flush_timer.schedule()
+
+    def handle_batch(self, texts: List[str]) -> None:
+        with self._lock:
+            self._buffer.extend(f"{text}\n".encode('utf-8') for text in texts)
+            self.flush()
+
+    def flush(self) -> None:
+        with self._lock:
+            self._flush_timer.cancel()
+            if not self._buffer:
+                return
+            lines, self._buffer = self._buffer, []
+            if not (self._connect() and self._write(lines)):
+                self._spool(lines)
+
+    def close(self) -> None:
+        with self._lock:
+            self.flush()
+            if self._socket is not None:
+                self._socket.close()
+                self._socket = None
+        atexit.unregister(self.close)
 
 
 class SyslogHandler(LogHandlerProtocol):
+    SEVERITIES = {
+        LogLevel.DEBUG: 7,
+        LogLevel.INFO: 6,
+        LogLevel.WARNING: 4,
+        LogLevel.ERROR: 3,
+    }
+
+    def __init__(self,
+                 address: str | tuple[str, int] = "/dev/log",
+                 facility: int = 1,
+                 app_name: str = "Lab3",
+                 retry_interval: float = 1.0) -> None:
+        self.address = address
+        self.facility = facility
+        self.app_name = app_name
+        self.retry_interval = retry_interval
+        self.hostname = socket.gethostname() or "-"
+        self.dropped = 0
+        self._socket: socket.socket | None = None
+        self._stream = False
+        self._retry_at = 0.0
+        self._lock = threading.RLock()
+
+    def format(self, message: str, level: LogLevel | None, timestamp: float) -> bytes:
+        priority = self.facility * 8 + self.SEVERITIES.get(level, 6)
+        moment = datetime.datetime.fromtimestamp(timestamp, tz=datetime.timezone.utc)
+        stamp = moment.isoformat(timespec='microseconds').replace('+00:00', 'Z')
+        return f"<{priority}>1 {stamp} {self.hostname} {self.app_name} {os.getpid()} - - {message}".encode('utf-8')
+
+    def _connect(self) -> bool:
+        with self._lock:
+            if self._socket is not None:
+                return True
+            if time.monotonic() < self._retry_at:
+                return False
+            try:
+                if isinstance(self.address, str):
+                    try:
+                        sock = socket.socket(socket.AF_UNIX, socket.SOCK_DGRAM)
+                        sock.connect(self.address)
+                        self._stream = False
+                    except OSError as e:
+                        sock.close()
+                        if e.errno != errno.EPROTOTYPE:
+                            raise
+                        sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+                        sock.connect(self.address)
+                        self._stream = True
+                else:
+                    sock = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+                    sock.connect(self.address)
+                    self._stream = False
+            except OSError:
+                self._retry_at = time.monotonic() + self.retry_interval
+                return False
+            self._socket = sock
+            return True
+
+    def _send(self, messages: List[bytes]) -> None:
+        with self._lock:
+            if not self._connect():
+                self.dropped += len(messages)
+                return
+            try:
+                if self._stream:
+                    self._socket.sendall(b"".join(b"%d %s" % (len(message), message) for message in messages))
+                else:
+                    for message in messages:
+                        self._socket.send(message)
+            except OSError:
+                self._socket.close()
+                self._socket = None
+                self._retry_at = time.monotonic() + self.retry_interval
+                self.dropped += len(messages)
+
     def handle(self, text: str) -> None:
-        print(f"[SYSLOG] Logging to system log: {text}")
+        self._send([self.format(text, None, time.time())])
+
+    def handle_batch(self, texts: List[str]) -> None:
+        now = time.time()
+        self._send([self.format(text, None, now) for text in texts])
+
+    def handle_record(self, record: LogRecord) -> None:
+        self._send([self.format(record.message, record.level, record.timestamp)])
+
+    def handle_records(self, records: List[LogRecord]) -> None:
+        self._send([self.format(record.message, record.level, record.timestamp) for record in records])
+
+    def close(self) -> None:
+        with self._lock:
+            if self._socket is not None:
+                self._socket.close()
+                self._socket = None
 
 
 class Logger:
@@ -59,14 +441,28 @@ class Logger:
         self.filters = filters if filters is not None else []
         self.handlers = handlers if handlers is not None else []
 
-    def log(self, text: str) -> None:
+    def log(self, text: str, *args: Any, level: LogLevel | None = None, **fields: Any) -> None:
+        record = LogRecord(text, args, level, fields)
         for log_filter in self.filters:
-            if not log_filter.match(text):
+            if not log_filter.match_record(record):
                 return
-        text =f"[{datetime.datetime.now()}]: {text}"
+        self._emit(record)
+
+    def debug(self, text: str, *args: Any, **fields: Any) -> None:
+        self.log(text, *args, level=LogLevel.DEBUG, **fields)
+
+    def info(self, text: str, *args: Any, **fields: Any) -> None:
+        self.log(text, *args, level=LogLevel.INFO, **fields)
+
+    def warning(self, text: str, *args: Any, **fields: Any) -> None:
+        self.log(text, *args, level=LogLevel.WARNING, **fields)
+
+    def error(self, text: str, *args: Any, **fields: Any) -> None:
+        self.log(text, *args, level=LogLevel.ERROR, **fields)
 
+    def _emit(self, record: LogRecord) -> None:
         for handler in self.handlers:
-            handler.handle(text)
+            handler.handle_record(record)
 
 
 def main():
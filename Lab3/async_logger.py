@@ -0,0 +1,112 @@
+import atexit
+import sys
+import threading
+from collections import deque
+from enum import Enum
+from typing import List
+from Lab3 import Logger, LogFilterProtocol, LogHandlerProtocol, LogRecord
+
+
+class Backpressure(Enum):
+    BLOCK = "block"
+    DROP_OLDEST = "drop_oldest"
+    DROP_NEWEST = "drop_newest"
+
+
+class AsyncLogger(Logger):
+    def __init__(self,
+                 filters: List[LogFilterProtocol] = None,
+                 handlers: List[LogHandlerProtocol] = None,
+                 max_queue_size: int = 10000,
+                 batch_size: int = 256,
+                 flush_interval: float = 0.1,
+                 backpressure: Backpressure = Backpressure.BLOCK) -> None:
+        super().__init__(filters, handlers)
+        if max_queue_size <= 0 or batch_size <= 0:
+            raise ValueError("max_queue_size and batch_size must be positive")
+        self.max_queue_size = max_queue_size
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self.backpressure = backpressure
+        self.dropped = 0
+        self._queue: deque[LogRecord] = deque()
+        self._pending = 0
+        self._closed = False
+        self._condition = threading.Condition()
+        self._worker = threading.Thread(target=self._run, name="AsyncLogger", daemon=True)
+        self._worker.start()
+        atexit.register(self.close)
+
+    def _emit(self, record: LogRecord) -> None:
+        with self._condition:
+            if self._closed:
+                raise ValueError("Logger is closed")
+            if len(self._queue) >= self.max_queue_size:
+                match self.backpressure:
+                    case Backpressure.BLOCK:
+                        self._condition.wait_for(
+                            lambda: len(self._queue) < self.max_queue_size or self._closed)
+                        if self._closed:
+                            raise ValueError("Logger is closed")
+                    case Backpressure.DROP_OLDEST:
+                        self._queue.popleft()
+                        self._pending -= 1
+                        self.dropped += 1
+                    case Backpressure.DROP_NEWEST:
+                        self.dropped += 1
+                        return
+            self._queue.append(record)
+            self._pending += 1
+            if len(self._queue) >= self.batch_size:
+                self._condition.notify_all()
+
+    def _take_batch(self) -> List[LogRecord]:
+        with self._condition:
+            if not self._queue and not self._closed:
+                self._condition.wait(self.flush_interval)
+            count = min(len(self._queue), self.batch_size)
+            batch = [self._queue.popleft() for _ in range(count)]
+            self._condition.notify_all()
+            return batch
+
+    def _run(self) -> None:
+        while True:
+            batch = self._take_batch()
+            if batch:
+                for handler in self.handlers:
+                    try:
+                        handler.handle_records(batch)
+                    except Exception as e:
+                        print(f"[AsyncLogger] Handler {type(handler).__name__} failed: {e}", file=sys.stderr)
+                with self._condition:
+                    self._pending -= len(batch)
+                    self._condition.notify_all()
+            else:
+                with self._condition:
+                    if self._closed and not self._queue:
+                        return
+
+    @property
+    def pending(self) -> int:
+        with self._condition:
+            return self._pending
+
+    def flush(self, timeout: float | None = None) -> bool:
+        with self._condition:
+            self._condition.notify_all()
+            return self._condition.wait_for(lambda: self._pending <= 0, timeout)
+
+    def close(self) -> None:
+        with self._condition:
+            if self._closed:
+                return
+            self._closed = True
+            self._condition.notify_all()
+        self._worker.join()
+        atexit.unregister(self.close)
+
+    def __enter__(self) -> 'AsyncLogger':
+        return self
+
+    def __exit__(self, *args) -> None:
+        self.close()
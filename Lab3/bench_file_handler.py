@@ -0,0 +1,36 @@
+import os
+import sys
+import tempfile
+import time
+from Lab3 import FileHandler
+from file_handlers import BufferedFileHandler
+
+
+def measure(handler, count: int) -> float:
+    start = time.perf_counter()
+    for i in range(count):
+        handler.handle(f"[2025-05-25 12:01:46.351114]: ERROR: message {i}")
+    if hasattr(handler, 'close'):
+        handler.close()
+    return time.perf_counter() - start
+
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 1_000_000
+    with tempfile.TemporaryDirectory() as directory:
+        cases = [
+            ("FileHandler", FileHandler(os.path.join(directory, "plain.log"))),
+            ("BufferedFileHandler", BufferedFileHandler(os.path.join(directory, "buffered.log"))),
+            ("BufferedFileHandler + rotation",
+             BufferedFileHandler(os.path.join(directory, "rotated.log"), max_bytes=8 * 1024 * 1024, backup_count=3)),
+        ]
+
+        print(f"{count} сообщений")
+        print(f"{'обработчик':<34}{'время, с':>10}{'сообщ./с':>14}")
+        for name, handler in cases:
+            elapsed = measure(handler, count)
+            print(f"{name:<34}{elapsed:>10.2f}{count / elapsed:>14,.0f}")
+
+
+if __name__ == "__main__":
+    main()
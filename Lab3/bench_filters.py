@@ -0,0 +1,57 @@
+import random
+import string
+import time
+from typing import List
+from Lab3 import LogFilterProtocol, SimpleLogFilter, ReLogFilter, OrLogFilter
+from filter_compiler import compile_filters
+
+MESSAGES = 5_000
+
+
+def word() -> str:
+    return "".join(random.choices(string.ascii_lowercase, k=random.randint(4, 8)))
+
+
+def chain_match(filters: List[LogFilterProtocol], text: str) -> bool:
+    for log_filter in filters:
+        if not log_filter.match(text):
+            return False
+    return True
+
+
+def measure(match, messages: List[str]) -> tuple[float, int]:
+    start = time.perf_counter()
+    passed = sum(1 for message in messages if match(message))
+    return (time.perf_counter() - start) / len(messages) * 1e6, passed
+
+
+def and_scenario(count: int) -> tuple[List[LogFilterProtocol], List[str]]:
+    keywords = [word() for _ in range(count)]
+    filters: List[LogFilterProtocol] = [SimpleLogFilter(keyword) for keyword in keywords[:count - count // 4]]
+    filters += [ReLogFilter(rf"{keyword}=\d+") for keyword in keywords[count - count // 4:]]
+    messages = [" ".join(f"{keyword}={random.randint(0, 999)}" for keyword in keywords) for _ in range(MESSAGES)]
+    return filters, messages
+
+
+def or_scenario(count: int) -> tuple[List[LogFilterProtocol], List[str]]:
+    keywords = [word() for _ in range(count)]
+    alternatives: List[LogFilterProtocol] = [SimpleLogFilter(keyword) for keyword in keywords[:count - count // 4]]
+    alternatives += [ReLogFilter(rf"{keyword}\d") for keyword in keywords[count - count // 4:]]
+    messages = [" ".join(word() for _ in range(12)) for _ in range(MESSAGES)]
+    return [OrLogFilter(*alternatives)], messages
+
+
+def main():
+    print(f"{'сценарий':<10}{'фильтров':>10}{'цепочка, мкс':>15}{'компил., мкс':>15}{'ускорение':>12}")
+    for name, scenario in (("AND", and_scenario), ("OR", or_scenario)):
+        for count in (1, 10, 100, 1000):
+            filters, messages = scenario(count)
+            compiled = compile_filters(filters)
+            chain_time, chain_passed = measure(lambda text: chain_match(filters, text), messages)
+            compiled_time, compiled_passed = measure(compiled.match, messages)
+            assert chain_passed == compiled_passed
+            print(f"{name:<10}{count:>10}{chain_time:>15.2f}{compiled_time:>15.2f}{chain_time / compiled_time:>11.1f}x")
+
+
+if __name__ == "__main__":
+    main()
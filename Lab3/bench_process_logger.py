@@ -0,0 +1,66 @@
+import functools
+import multiprocessing
+import os
+import sys
+import tempfile
+import time
+from Lab3 import Logger, FileHandler
+from file_handlers import BufferedFileHandler
+from process_logger import ProcessLogListener, QueueLogger
+
+MESSAGES_PER_WORKER = 5_000
+
+
+def shared_file_worker(path: str, worker: int) -> None:
+    logger = Logger(handlers=[FileHandler(path)])
+    for i in range(MESSAGES_PER_WORKER):
+        logger.log("ERROR: worker {} message {}", worker, i)
+
+
+def queue_worker(records: multiprocessing.Queue, worker: int) -> None:
+    with QueueLogger(records) as logger:
+        for i in range(MESSAGES_PER_WORKER):
+            logger.log("ERROR: worker {} message {}", worker, i)
+
+
+def buffered_handlers(path: str) -> list:
+    return [BufferedFileHandler(path)]
+
+
+def run_workers(target, first_arg, workers: int) -> None:
+    processes = [multiprocessing.Process(target=target, args=(first_arg, worker)) for worker in range(workers)]
+    for process in processes:
+        process.start()
+    for process in processes:
+        process.join()
+
+
+def count_lines(path: str) -> int:
+    with open(path, 'rb') as file:
+        return sum(1 for _ in file)
+
+
+def main():
+    worker_counts = [int(arg) for arg in sys.argv[1:]] or [4, 8, 16]
+    print(f"{MESSAGES_PER_WORKER} сообщений на процесс")
+    print(f"{'процессов':>10}{'общий файл, с':>16}{'процесс-писатель, с':>22}{'ускорение':>12}")
+    with tempfile.TemporaryDirectory() as directory:
+        for workers in worker_counts:
+            shared_path = os.path.join(directory, f"shared{workers}.log")
+            start = time.perf_counter()
+            run_workers(shared_file_worker, shared_path, workers)
+            shared = time.perf_counter() - start
+
+            listener_path = os.path.join(directory, f"listener{workers}.log")
+            start = time.perf_counter()
+            with ProcessLogListener(functools.partial(buffered_handlers, listener_path)) as listener:
+                run_workers(queue_worker, listener.records, workers)
+            single_writer = time.perf_counter() - start
+
+            expected = workers * MESSAGES_PER_WORKER
+            assert count_lines(shared_path) == expected and count_lines(listener_path) == expected
+            print(f"{workers:>10}{shared:>16.2f}{single_writer:>22.2f}{shared / single_writer:>11.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,123 @@
+import os
+import socket
+import socketserver
+import tempfile
+import threading
+import time
+from Lab3 import SocketHandler, SyslogHandler
+
+MESSAGES = 10_000
+
+
+class CountingTCPHandler(socketserver.BaseRequestHandler):
+    def handle(self) -> None:
+        while True:
+            data = self.request.recv(65536)
+            if not data:
+                break
+            with self.server.lock:
+                self.server.lines += data.count(b"\n")
+
+
+class CountingTCPServer(socketserver.ThreadingTCPServer):
+    daemon_threads = True
+    allow_reuse_address = True
+    request_queue_size = 128
+
+    def __init__(self) -> None:
+        super().__init__(("127.0.0.1", 0), CountingTCPHandler)
+        self.lock = threading.Lock()
+        self.lines = 0
+
+
+def wait_for(predicate, timeout: float = 10.0) -> None:
+    deadline = time.monotonic() + timeout
+    while not predicate() and time.monotonic() < deadline:
+        time.sleep(0.01)
+
+
+def per_message_tcp(address: tuple[str, int], text: str) -> None:
+    with socket.create_connection(address) as sock:
+        sock.sendall(f"{text}\n".encode('utf-8'))
+
+
+def per_message_syslog(address: str, handler: SyslogHandler, text: str) -> None:
+    with socket.socket(socket.AF_UNIX, socket.SOCK_DGRAM) as sock:
+        sock.connect(address)
+        sock.send(handler.format(text, None, time.time()))
+
+
+def bench_tcp() -> None:
+    server = CountingTCPServer()
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    address = server.server_address
+
+    start = time.perf_counter()
+    for i in range(MESSAGES):
+        per_message_tcp(address, f"ERROR: message {i}")
+    wait_for(lambda: server.lines >= MESSAGES)
+    baseline = time.perf_counter() - start
+
+    server.lines = 0
+    handler = SocketHandler(address)
+    start = time.perf_counter()
+    for i in range(MESSAGES):
+        handler.handle(f"ERROR: message {i}")
+    handler.close()
+    wait_for(lambda: server.lines >= MESSAGES)
+    batched = time.perf_counter() - start
+
+    server.shutdown()
+    report("TCP", baseline, batched)
+
+
+def bench_syslog() -> None:
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, "log.sock")
+        server = socket.socket(socket.AF_UNIX, socket.SOCK_DGRAM)
+        server.bind(path)
+        server.setsockopt(socket.SOL_SOCKET, socket.SO_RCVBUF, 1 << 22)
+        received = [0]
+
+        def receive() -> None:
+            while True:
+                try:
+                    server.recv(65536)
+                except OSError:
+                    return
+                received[0] += 1
+
+        threading.Thread(target=receive, daemon=True).start()
+
+        handler = SyslogHandler(path)
+        start = time.perf_counter()
+        for i in range(MESSAGES):
+            per_message_syslog(path, handler, f"ERROR: message {i}")
+        wait_for(lambda: received[0] >= MESSAGES)
+        baseline = time.perf_counter() - start
+
+        received[0] = 0
+        start = time.perf_counter()
+        for i in range(MESSAGES):
+            handler.handle(f"ERROR: message {i}")
+        wait_for(lambda: received[0] >= MESSAGES)
+        reused = time.perf_counter() - start
+
+        handler.close()
+        server.close()
+        report("Syslog", baseline, reused)
+
+
+def report(name: str, baseline: float, optimized: float) -> None:
+    print(f"{name:<8}{MESSAGES / baseline:>18,.0f}{MESSAGES / optimized:>18,.0f}{baseline / optimized:>11.1f}x")
+
+
+def main():
+    print(f"{MESSAGES} сообщений")
+    print(f"{'':<8}{'соединение/сообщ.':>18}{'постоянное':>18}{'ускорение':>12}")
+    bench_tcp()
+    bench_syslog()
+
+
+if __name__ == "__main__":
+    main()
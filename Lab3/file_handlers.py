@@ -0,0 +1,109 @@
+import atexit
+import os
+import threading
+import time
+from typing import List
+from Lab3 import FlushTimer, LogHandlerProtocol
+
+
+class BufferedFileHandler(LogHandlerProtocol):
+    def __init__(self,
+                 file_path: str,
+                 buffer_size: int = 64 * 1024,
+                 flush_interval: float | None = 1.0,
+                 max_bytes: int | None = None,
+                 rotate_interval: float | None = None,
+                 backup_count: int = 5) -> None:
+        if buffer_size < 0 or backup_count < 0:
+            raise ValueError("buffer_size and backup_count must not be negative")
+        self.file_path = file_path
+        self.buffer_size = buffer_size
+        self.flush_interval = flush_interval
+        self.max_bytes = max_bytes
+        self.rotate_interval = rotate_interval
+        self.backup_count = backup_count
+        self._buffer: List[str] = []
+        self._buffered = 0
+        self._lock = threading.RLock()
+        self._flush_timer = FlushTimer(flush_interval, self.flush)
+        self._file = None
+        self._file_size = 0
+        self._opened_at = 0.0
+        self._open()
+        atexit.register(self.close)
+
+    def _open(self) -> None:
+        self._file = open(self.file_path, 'a', encoding='utf-8')
+        self._file_size = self._file.tell()
+        self._opened_at = time.monotonic()
+
+    def _should_rotate(self, incoming: int) -> bool:
+        written = self._file_size + self._buffered
+        if written == 0:
+            return False
+        if self.max_bytes is not None and written + incoming > self.max_bytes:
+            return True
+        if self.rotate_interval is not None and time.monotonic() - self._opened_at >= self.rotate_interval:
+            return True
+        return False
+
+    def rotate(self) -> None:
+        with self._lock:
+            self.flush()
+            self._file.close()
+            if self.backup_count > 0:
+                for i in range(self.backup_count - 1, 0, -1):
+                    source = f"{self.file_path}.{i}"
+                    if os.path.exists(source):
+                        os.replace(source, f"{self.file_path}.{i + 1}")
+                os.replace(self.file_path, f"{self.file_path}.1")
+            else:
+                os.remove(self.file_path)
+            self._open()
+
+    def handle(self, text: str) -> None:
+        with self._lock:
+            if self._file is None:
+                raise ValueError("Handler is closed")
+            line = f"{text}\n"
+            size = len(line.encode('utf-8')) if self.max_bytes is not None else len(line)
+            if (self.max_bytes is not None or self.rotate_interval is not None) and self._should_rotate(size):
+                self.rotate()
+            self._buffer.append(line)
+            self._buffered += size
+            if self._buffered >= self.buffer_size:
+                self.flush()
+            else:
+                self._flush_timer.schedule()
+
+    def handle_batch(self, texts: List[str]) -> None:
+        with self._lock:
+            for text in texts:
+                self.handle(text)
+
+    def flush(self) -> None:
+        with self._lock:
+            self._flush_timer.cancel()
+            if self._file is None:
+                return
+            if self._buffer:
+                self._file.write("".join(self._buffer))
+                self._file_size += self._buffered
+                self._buffer.clear()
+                self._buffered = 0
+            self._file.flush()
+
+    def close(self) -> None:
+        with self._lock:
+            if self._file is None:
+                return
+            self.flush()
+            self._file.close()
+            self._file = None
+        atexit.unregister(self.close)
+
+    def __enter__(self) -> 'BufferedFileHandler':
+        return self
+
+    def __exit__(self, *args) -> None:
+        self.close()
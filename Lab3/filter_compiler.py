@@ -0,0 +1,205 @@
+import re
+from collections import deque
+from typing import List, Protocol
+from Lab3 import (LogFilterProtocol, LogRecord, SimpleLogFilter, ReLogFilter,
+                  AndLogFilter, OrLogFilter, NotLogFilter)
+
+AHO_CORASICK_THRESHOLD = 256
+_DEFAULT_FLAGS = re.compile("").flags
+_UNMERGEABLE = re.compile(r"\\[1-9]|\(\?P[<=]|\(\?\(")
+
+
+class AhoCorasick:
+    def __init__(self, patterns: List[str]) -> None:
+        self.patterns = list(patterns)
+        goto: List[dict[str, int]] = [{}]
+        output = [0]
+        for index, pattern in enumerate(self.patterns):
+            state = 0
+            for char in pattern:
+                next_state = goto[state].get(char)
+                if next_state is None:
+                    goto.append({})
+                    output.append(0)
+                    next_state = len(goto) - 1
+                    goto[state][char] = next_state
+                state = next_state
+            output[state] |= 1 << index
+
+        fail = [0] * len(goto)
+        delta: List[dict[str, int]] = [dict(goto[0])] + [{} for _ in range(len(goto) - 1)]
+        queue = deque(goto[0].values())
+        while queue:
+            state = queue.popleft()
+            delta[state] = {**delta[fail[state]], **goto[state]}
+            output[state] |= output[fail[state]]
+            for char, next_state in goto[state].items():
+                fail[next_state] = delta[fail[state]].get(char, 0)
+                queue.append(next_state)
+
+        self._delta = delta
+        self._output = output
+
+    def _scan(self, text: str, target: int) -> int:
+        delta = self._delta
+        output = self._output
+        state = 0
+        found = output[0]
+        for char in text:
+            state = delta[state].get(char, 0)
+            if output[state]:
+                found |= output[state]
+                if found & target == target:
+                    break
+        return found
+
+    def contains_all(self, text: str) -> bool:
+        target = (1 << len(self.patterns)) - 1
+        return self._scan(text, target) == target
+
+    def contains_any(self, text: str) -> bool:
+        return self._scan(text, 0) != 0
+
+
+class _Node(Protocol):
+    def evaluate(self, text: str) -> bool:
+        pass
+
+    def evaluate_record(self, record: LogRecord) -> bool:
+        pass
+
+
+class _Regex(_Node):
+    def __init__(self, regex: re.Pattern) -> None:
+        self.search = regex.search
+
+    def evaluate(self, text: str) -> bool:
+        return self.search(text) is not None
+
+    def evaluate_record(self, record: LogRecord) -> bool:
+        return self.search(record.message) is not None
+
+
+class _Opaque(_Node):
+    def __init__(self, log_filter: LogFilterProtocol) -> None:
+        self.evaluate = log_filter.match
+        self.evaluate_record = log_filter.match_record
+
+
+class _Not(_Node):
+    def __init__(self, child: _Node) -> None:
+        self.child = child
+
+    def evaluate(self, text: str) -> bool:
+        return not self.child.evaluate(text)
+
+    def evaluate_record(self, record: LogRecord) -> bool:
+        return not self.child.evaluate_record(record)
+
+
+class _Group(_Node):
+    def __init__(self, literals: List[str], children: List[_Node], conjunction: bool) -> None:
+        self.literals = tuple(dict.fromkeys(literals))
+        self.automaton = AhoCorasick(self.literals) if len(self.literals) >= AHO_CORASICK_THRESHOLD else None
+        self.checks = [child.evaluate for child in children]
+        self.record_checks = [child.evaluate_record for child in children]
+        self.conjunction = conjunction
+        if len(self.literals) == 1 and not self.checks:
+            self.evaluate = self._evaluate_literal
+
+    def _evaluate_literal(self, text: str) -> bool:
+        return self.literals[0] in text
+
+    def _contains_all(self, text: str) -> bool:
+        if self.automaton is not None:
+            return self.automaton.contains_all(text)
+        return all(map(text.__contains__, self.literals))
+
+    def _contains_any(self, text: str) -> bool:
+        if self.automaton is not None:
+            return self.automaton.contains_any(text)
+        return any(map(text.__contains__, self.literals))
+
+    def evaluate(self, text: str) -> bool:
+        if self.conjunction:
+            if not self._contains_all(text):
+                return False
+            for check in self.checks:
+                if not check(text):
+                    return False
+            return True
+
+        if self.literals and self._contains_any(text):
+            return True
+        for check in self.checks:
+            if check(text):
+                return True
+        return False
+
+    def evaluate_record(self, record: LogRecord) -> bool:
+        if self.conjunction:
+            if self.literals and not self._contains_all(record.message):
+                return False
+            for check in self.record_checks:
+                if not check(record):
+                    return False
+            return True
+
+        if self.literals and self._contains_any(record.message):
+            return True
+        for check in self.record_checks:
+            if check(record):
+                return True
+        return False
+
+
+def _mergeable(regex: re.Pattern) -> bool:
+    return regex.flags == _DEFAULT_FLAGS and not _UNMERGEABLE.search(regex.pattern)
+
+
+def _flatten(filters: List[LogFilterProtocol], group_type: type) -> List[LogFilterProtocol]:
+    result = []
+    for log_filter in filters:
+        if type(log_filter) is group_type:
+            result.extend(_flatten(log_filter.filters, group_type))
+        else:
+            result.append(log_filter)
+    return result
+
+
+def _build(log_filter: LogFilterProtocol) -> _Node:
+    if type(log_filter) is SimpleLogFilter:
+        return _Group([log_filter.pattern], [], conjunction=True)
+    if type(log_filter) is ReLogFilter:
+        return _Regex(log_filter.regex)
+    if type(log_filter) is NotLogFilter:
+        return _Not(_build(log_filter.filter))
+    if type(log_filter) is AndLogFilter:
+        return _build_group(log_filter.filters, conjunction=True)
+    if type(log_filter) is OrLogFilter:
+        return _build_group(log_filter.filters, conjunction=False)
+    return _Opaque(log_filter)
+
+
+def _build_group(filters: List[LogFilterProtocol], conjunction: bool) -> _Node:
+    filters = _flatten(filters, AndLogFilter if conjunction else OrLogFilter)
+    literals = [f.pattern for f in filters if type(f) is SimpleLogFilter]
+    regexes = [f.regex for f in filters if type(f) is ReLogFilter]
+    children = [_build(f) for f in filters if type(f) not in (SimpleLogFilter, ReLogFilter)]
+
+    mergeable = [regex for regex in regexes if _mergeable(regex)]
+    if not conjunction and len(mergeable) > 1:
+        combined = re.compile("|".join(f"(?:{regex.pattern})" for regex in mergeable))
+        regexes = [combined] + [regex for regex in regexes if not _mergeable(regex)]
+    return _Group(literals, [_Regex(regex) for regex in regexes] + children, conjunction)
+
+
+class CompiledLogFilter(LogFilterProtocol):
+    def __init__(self, filters: List[LogFilterProtocol]) -> None:
+        self.root = _build_group(list(filters), conjunction=True)
+        self.match = self.root.evaluate
+        self.match_record = self.root.evaluate_record
+
+
+def compile_filters(filters: List[LogFilterProtocol]) -> CompiledLogFilter:
+    return CompiledLogFilter(filters)
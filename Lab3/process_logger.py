@@ -0,0 +1,106 @@
+import multiprocessing
+import multiprocessing.util
+import queue
+import sys
+import threading
+from typing import Callable, List
+from Lab3 import FlushTimer, Logger, LogFilterProtocol, LogHandlerProtocol, LogRecord
+
+FINALIZE_PRIORITY = 20
+
+
+def _listen(records: multiprocessing.Queue, handlers_factory: Callable[[], List[LogHandlerProtocol]]) -> None:
+    handlers = handlers_factory()
+    while True:
+        batch = records.get()
+        if batch is None:
+            break
+        for handler in handlers:
+            try:
+                handler.handle_records(batch)
+            except Exception as e:
+                print(f"[ProcessLogListener] Handler {type(handler).__name__} failed: {e}", file=sys.stderr)
+    for handler in handlers:
+        close = getattr(handler, 'close', None)
+        if close is not None:
+            close()
+
+
+class QueueLogger(Logger):
+    def __init__(self,
+                 records: multiprocessing.Queue,
+                 filters: List[LogFilterProtocol] = None,
+                 batch_size: int = 100,
+                 flush_interval: float | None = 0.5,
+                 put_timeout: float | None = None) -> None:
+        super().__init__(filters, [])
+        self.records = records
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self.put_timeout = put_timeout
+        self.dropped = 0
+        self._buffer: List[LogRecord] = []
+        self._lock = threading.RLock()
+        self._flush_timer = FlushTimer(flush_interval, self.flush)
+        self._finalizer = multiprocessing.util.Finalize(self, self.close, exitpriority=FINALIZE_PRIORITY)
+
+    def _emit(self, record: LogRecord) -> None:
+        record = record.detached()
+        with self._lock:
+            self._buffer.append(record)
+            if len(self._buffer) >= self.batch_size:
+                self.flush()
+            else:
+                self._flush_timer.schedule()
+
+    def flush(self) -> None:
+        with self._lock:
+            self._flush_timer.cancel()
+            if not self._buffer:
+                return
+            batch, self._buffer = self._buffer, []
+            try:
+                self.records.put(batch, timeout=self.put_timeout)
+            except queue.Full:
+                self.dropped += len(batch)
+
+    def close(self) -> None:
+        self.flush()
+        self._finalizer.cancel()
+
+    def __enter__(self) -> 'QueueLogger':
+        return self
+
+    def __exit__(self, *args) -> None:
+        self.close()
+
+
+class ProcessLogListener:
+    def __init__(self,
+                 handlers_factory: Callable[[], List[LogHandlerProtocol]],
+                 max_queue_size: int = 1000,
+                 context: str | None = None) -> None:
+        self._context = multiprocessing.get_context(context)
+        self.records = self._context.Queue(max_queue_size)
+        self._process = self._context.Process(target=_listen, args=(self.records, handlers_factory),
+                                              name="ProcessLogListener", daemon=True)
+
+    def start(self) -> None:
+        self._process.start()
+
+    def logger(self, filters: List[LogFilterProtocol] = None, batch_size: int = 100,
+               flush_interval: float | None = 0.5, put_timeout: float | None = None) -> QueueLogger:
+        return QueueLogger(self.records, filters, batch_size, flush_interval, put_timeout)
+
+    def stop(self, timeout: float | None = None) -> None:
+        if not self._process.is_alive():
+            return
+        self.records.put(None)
+        self._process.join(timeout)
+
+    def __enter__(self) -> 'ProcessLogListener':
+        self.start()
+        return self
+
+    def __exit__(self, *args) -> None:
+        self.stop()
@@ -0,0 +1,77 @@
+import datetime
+import threading
+from typing import Iterator, List
+from Lab3 import LogFilterProtocol, LogHandlerProtocol, LogRecord
+
+
+class RingBufferHandler(LogHandlerProtocol):
+    def __init__(self, capacity: int = 10000) -> None:
+        if capacity <= 0:
+            raise ValueError("capacity must be positive")
+        self.capacity = capacity
+        self._records: List[LogRecord | None] = [None] * capacity
+        self._next = 0
+        self._count = 0
+        self._lock = threading.Lock()
+
+    def handle(self, text: str) -> None:
+        self.handle_record(LogRecord.rendered(text))
+
+    def handle_record(self, record: LogRecord) -> None:
+        with self._lock:
+            self._records[self._next] = record
+            self._next = (self._next + 1) % self.capacity
+            if self._count < self.capacity:
+                self._count += 1
+
+    def handle_records(self, records: List[LogRecord]) -> None:
+        with self._lock:
+            for record in records[-self.capacity:]:
+                self._records[self._next] = record
+                self._next = (self._next + 1) % self.capacity
+            self._count = min(self._count + len(records), self.capacity)
+
+    def _snapshot(self) -> List[LogRecord]:
+        with self._lock:
+            start = (self._next - self._count) % self.capacity
+            if start + self._count <= self.capacity:
+                return self._records[start:start + self._count]
+            return self._records[start:] + self._records[:self._next]
+
+    def __len__(self) -> int:
+        return self._count
+
+    def __iter__(self) -> Iterator[LogRecord]:
+        return iter(self._snapshot())
+
+    def clear(self) -> None:
+        with self._lock:
+            self._records = [None] * self.capacity
+            self._next = 0
+            self._count = 0
+
+    def tail(self, n: int = 10) -> List[LogRecord]:
+        if n <= 0:
+            return []
+        with self._lock:
+            n = min(n, self._count)
+            start = (self._next - n) % self.capacity
+            if start + n <= self.capacity:
+                return self._records[start:start + n]
+            return self._records[start:] + self._records[:self._next]
+
+    def between(self, start: datetime.datetime | float, end: datetime.datetime | float) -> List[LogRecord]:
+        if isinstance(start, datetime.datetime):
+            start = start.timestamp()
+        if isinstance(end, datetime.datetime):
+            end = end.timestamp()
+        return [record for record in self._snapshot() if start <= record.timestamp <= end]
+
+    def query(self, log_filter: LogFilterProtocol) -> List[LogRecord]:
+        return [record for record in self._snapshot() if log_filter.match_record(record)]
+
+    def dump(self, handler: LogHandlerProtocol, log_filter: LogFilterProtocol | None = None) -> int:
+        records = self._snapshot() if log_filter is None else self.query(log_filter)
+        if records:
+            handler.handle_records(records)
+        return len(records)
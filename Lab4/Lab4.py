@@ -1,12 +1,13 @@
 from user import User
-from data_changing import EmailValidator, NameValidator
+from data_changing import EmailValidator, NameValidator, print_failure
 from data_changed import ConsoleLogger
+from deferred_listeners import ThreadedListener
 
 
 def main():
     user = User()
-    user.add_property_changing_listener(EmailValidator())
-    user.add_property_changing_listener(NameValidator())
+    user.add_property_changing_listener(EmailValidator(print_failure), "email")
+    user.add_property_changing_listener(NameValidator(print_failure), "name")
     user.add_property_changed_listener(ConsoleLogger())
 
     print("\nКорректный ввод")
@@ -17,6 +18,25 @@ def main():
     user.name = ""
     user.email = "AA@AAAA@AAAA.ru"
 
+    print("\nПакетное изменение")
+    with user.batch_update() as batch:
+        user.name = "Other"
+        user.email = "Other@example.com"
+    print(f"Применено: {batch.committed}")
+
+    print("\nПакетное изменение с ошибкой")
+    with user.batch_update() as batch:
+        user.name = "Third"
+        user.email = "broken"
+    print(f"Применено: {batch.committed}")
+
+    print("\nФоновый слушатель")
+    with ThreadedListener(ConsoleLogger()) as background:
+        user.add_property_changed_listener(background, "name")
+        user.name = "Background"
+        background.flush()
+        user.remove_property_changed_listener(background)
+
     print("\nИтоговые значения:")
     print(f"Имя: {user.name}, Email: {user.email}")
 
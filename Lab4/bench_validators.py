@@ -0,0 +1,77 @@
+import io
+import random
+import sys
+import time
+from data_changing import EmailValidator, NameValidator
+
+VALUES = 200_000
+DISTINCT = 1_000
+
+
+class LegacyEmailValidator:
+    def on_property_changing(self, obj, property_name: str, old_value, new_value) -> bool:
+        if property_name != 'email':
+            return True
+        if not isinstance(new_value, str):
+            print("[EmailValidator] Ошибка: Email должно быть строкой!")
+            return False
+        if len(new_value) <= 5:
+            print("[EmailValidator] Ошибка: Email слишком короткий!")
+            return False
+        if new_value.count('@') != 1 or not '.' in new_value.split('@')[-1] or '.' in new_value.split('@')[0]:
+            print("[EmailValidator] Ошибка: Email не корректен!")
+            return False
+        return True
+
+
+class LegacyNameValidator:
+    def on_property_changing(self, obj, property_name: str, old_value, new_value) -> bool:
+        if property_name != "name":
+            return True
+        if not isinstance(new_value, str):
+            print("[NameValidator] Ошибка: имя должно быть строкой!")
+            return False
+        if len(new_value) == 0:
+            print("[NameValidator] Ошибка: имя не может быть пустым!")
+            return False
+        if not new_value.isalpha():
+            print("[NameValidator] Ошибка: имя не должно содержать цифр!")
+            return False
+        return True
+
+
+def make_values(seed: int = 42) -> tuple[list[str], list[str]]:
+    rng = random.Random(seed)
+    emails = [f"user{rng.randrange(10 ** 6)}@example{rng.choice(['.com', 'com', '.ru'])}" for _ in range(DISTINCT)]
+    names = [rng.choice(["Name", "Ivan", "Anna", "Name1", ""]) + "x" * rng.randrange(4) for _ in range(DISTINCT)]
+    return ([rng.choice(emails) for _ in range(VALUES)], [rng.choice(names) for _ in range(VALUES)])
+
+
+def measure(email_validator, name_validator, emails: list[str], names: list[str]) -> float:
+    check_email = email_validator.on_property_changing
+    check_name = name_validator.on_property_changing
+    stdout = sys.stdout
+    sys.stdout = io.StringIO()
+    try:
+        start = time.perf_counter()
+        for email, name in zip(emails, names):
+            check_email(None, 'email', None, email)
+            check_name(None, 'name', None, name)
+        return time.perf_counter() - start
+    finally:
+        sys.stdout = stdout
+
+
+def main():
+    emails, names = make_values()
+    legacy = measure(LegacyEmailValidator(), LegacyNameValidator(), emails, names)
+    compiled = measure(EmailValidator(None), NameValidator(None), emails, names)
+    cached = measure(EmailValidator(None, cache_size=4096), NameValidator(None, cache_size=4096), emails, names)
+    print(f"{VALUES} пар значений, {DISTINCT} различных")
+    print(f"Исходные валидаторы (print): {legacy:.3f} с")
+    print(f"Скомпилированные правила:    {compiled:.3f} с ({legacy / compiled:.1f}x)")
+    print(f"С кэшем вердиктов:           {cached:.3f} с ({legacy / cached:.1f}x)")
+
+
+if __name__ == "__main__":
+    main()
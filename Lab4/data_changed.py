@@ -3,4 +3,8 @@ from protocols import DataChangedProtocol, PropertyChangedListenerProtocol
 
 class ConsoleLogger(PropertyChangedListenerProtocol):
     def on_property_changed(self, obj : DataChangedProtocol, property_name: str) -> None:
-        print(f"[ConsoleLogger] Свойство '{property_name}' изменено. Новое значение: {getattr(obj, property_name)}")
\ No newline at end of file
+        print(f"[ConsoleLogger] Свойство '{property_name}' изменено. Новое значение: {getattr(obj, property_name)}")
+
+    def on_properties_changed(self, obj : DataChangedProtocol, property_names: tuple[str, ...]) -> None:
+        changes = ", ".join(f"'{name}' = {getattr(obj, name)}" for name in property_names)
+        print(f"[ConsoleLogger] Свойства изменены: {changes}")
\ No newline at end of file
@@ -1,34 +1,30 @@
-from protocols import PropertyChangingListenerProtocol, DataChangingProtocol
-from typing import Any
-
-
-class EmailValidator(PropertyChangingListenerProtocol):
-    def on_property_changing(self, obj : DataChangingProtocol, property_name: str, old_value: Any, new_value : Any) -> bool:
-        if property_name != 'email':
-            return True
-        if not isinstance(new_value,str):
-            print("[EmailValidator] Ошибка: Email должно быть строкой!")
-            return False
-        if len(new_value) <= 5:
-            print("[EmailValidator] Ошибка: Email слишком короткий!")
-            return False
-        if new_value.count('@') != 1 or not '.' in new_value.split('@')[-1] or '.' in new_value.split('@')[0]:
-            print("[EmailValidator] Ошибка: Email не корректен!")
-            return False
-        return True
-
-
-class NameValidator(PropertyChangingListenerProtocol):
-    def on_property_changing(self, obj  : DataChangingProtocol, property_name: str, old_value : Any, new_value : Any) -> bool:
-        if property_name != "name":
-            return True
-        if not isinstance(new_value,str):
-            print("[NameValidator] Ошибка: имя должно быть строкой!")
-            return False
-        if len(new_value) == 0:
-            print("[NameValidator] Ошибка: имя не может быть пустым!")
-            return False
-        if not new_value.isalpha():
-            print("[NameValidator] Ошибка: имя не должно содержать цифр!")
-            return False
-        return True
\ No newline at end of file
+from typing import Callable
+from validation import Charset, IsInstance, Length, Regex, RuleSet, RuleValidator, ValidationResult
+
+EMAIL_RULES = (
+    IsInstance(str, "Email должно быть строкой!"),
+    Length(6, message="Email слишком короткий!"),
+    Regex(r"[^@.]*@[^@]*\.[^@]*", "Email не корректен!"),
+)
+
+NAME_RULES = (
+    IsInstance(str, "имя должно быть строкой!"),
+    Length(1, message="имя не может быть пустым!"),
+    Charset(str.isalpha, "имя не должно содержать цифр!"),
+)
+
+
+def print_failure(result: ValidationResult) -> None:
+    print(f"[{result.source}] Ошибка: {result.message}")
+
+
+class EmailValidator(RuleValidator):
+    def __init__(self, on_failure: Callable[[ValidationResult], None] | None = None,
+                 cache_size: int = 0) -> None:
+        super().__init__({'email': RuleSet(*EMAIL_RULES, cache_size=cache_size)}, on_failure)
+
+
+class NameValidator(RuleValidator):
+    def __init__(self, on_failure: Callable[[ValidationResult], None] | None = None,
+                 cache_size: int = 0) -> None:
+        super().__init__({'name': RuleSet(*NAME_RULES, cache_size=cache_size)}, on_failure)
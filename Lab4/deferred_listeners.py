@@ -0,0 +1,142 @@
+import asyncio
+import inspect
+import sys
+import threading
+from collections import deque
+from concurrent.futures import Executor, ThreadPoolExecutor
+from typing import Any, Callable
+from protocols import PropertyChangedListenerProtocol
+
+
+class PropertySnapshot:
+    __slots__ = ('source', '_values')
+
+    def __init__(self, source: Any, property_names: tuple[str, ...]) -> None:
+        self.source = source
+        self._values = {name: getattr(source, name) for name in property_names}
+
+    def __getattr__(self, name: str) -> Any:
+        try:
+            return self._values[name]
+        except KeyError:
+            return getattr(self.source, name)
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}({self.source!r}, {self._values!r})"
+
+
+class ThreadedListener(PropertyChangedListenerProtocol):
+    def __init__(self, listener: PropertyChangedListenerProtocol, executor: Executor | None = None,
+                 max_workers: int = 4) -> None:
+        self.listener = listener
+        self._owns_executor = executor is None
+        self._executor = executor or ThreadPoolExecutor(max_workers, thread_name_prefix="ThreadedListener")
+        self._queues: dict[Any, deque[tuple[Callable, PropertySnapshot, Any]]] = {}
+        self._pending = 0
+        self._condition = threading.Condition()
+
+    def on_property_changed(self, obj : Any, property_name: str) -> None:
+        self._submit(obj, self.listener.on_property_changed, PropertySnapshot(obj, (property_name,)), property_name)
+
+    def on_properties_changed(self, obj : Any, property_names: tuple[str, ...]) -> None:
+        self._submit(obj, self.listener.on_properties_changed, PropertySnapshot(obj, property_names), property_names)
+
+    def _submit(self, obj: Any, callback: Callable, snapshot: PropertySnapshot, argument: Any) -> None:
+        with self._condition:
+            self._pending += 1
+            queue = self._queues.get(obj)
+            if queue is not None:
+                queue.append((callback, snapshot, argument))
+                return
+            self._queues[obj] = deque([(callback, snapshot, argument)])
+        self._executor.submit(self._drain, obj)
+
+    def _drain(self, obj: Any) -> None:
+        while True:
+            with self._condition:
+                queue = self._queues[obj]
+                if not queue:
+                    del self._queues[obj]
+                    return
+                callback, snapshot, argument = queue.popleft()
+            try:
+                callback(snapshot, argument)
+            except Exception as e:
+                print(f"[ThreadedListener] Ошибка слушателя {type(self.listener).__name__}: {e}", file=sys.stderr)
+            with self._condition:
+                self._pending -= 1
+                if not self._pending:
+                    self._condition.notify_all()
+
+    def flush(self, timeout: float | None = None) -> bool:
+        with self._condition:
+            return self._condition.wait_for(lambda: not self._pending, timeout)
+
+    def close(self) -> None:
+        self.flush()
+        if self._owns_executor:
+            self._executor.shutdown()
+
+    def __enter__(self) -> 'ThreadedListener':
+        return self
+
+    def __exit__(self, *args) -> None:
+        self.close()
+
+
+class AsyncListener(PropertyChangedListenerProtocol):
+    def __init__(self, listener: PropertyChangedListenerProtocol,
+                 loop: asyncio.AbstractEventLoop | None = None) -> None:
+        self.listener = listener
+        self._loop = loop or asyncio.get_running_loop()
+        self._queues: dict[Any, deque[tuple[Callable, PropertySnapshot, Any]]] = {}
+        self._tasks: dict[Any, asyncio.Task] = {}
+        batch_handler = getattr(type(listener), 'on_properties_changed', None)
+        self._expand_batches = batch_handler in (None, PropertyChangedListenerProtocol.on_properties_changed)
+
+    def on_property_changed(self, obj : Any, property_name: str) -> None:
+        self._submit(obj, self.listener.on_property_changed, PropertySnapshot(obj, (property_name,)), property_name)
+
+    def on_properties_changed(self, obj : Any, property_names: tuple[str, ...]) -> None:
+        callback = self._deliver_each if self._expand_batches else self.listener.on_properties_changed
+        self._submit(obj, callback, PropertySnapshot(obj, property_names), property_names)
+
+    async def _deliver_each(self, snapshot: PropertySnapshot, property_names: tuple[str, ...]) -> None:
+        for property_name in property_names:
+            result = self.listener.on_property_changed(snapshot, property_name)
+            if inspect.isawaitable(result):
+                await result
+
+    def _submit(self, obj: Any, callback: Callable, snapshot: PropertySnapshot, argument: Any) -> None:
+        try:
+            in_loop = asyncio.get_running_loop() is self._loop
+        except RuntimeError:
+            in_loop = False
+        if in_loop:
+            self._enqueue(obj, callback, snapshot, argument)
+        else:
+            self._loop.call_soon_threadsafe(self._enqueue, obj, callback, snapshot, argument)
+
+    def _enqueue(self, obj: Any, callback: Callable, snapshot: PropertySnapshot, argument: Any) -> None:
+        queue = self._queues.get(obj)
+        if queue is None:
+            queue = self._queues[obj] = deque()
+            self._tasks[obj] = self._loop.create_task(self._drain(obj, queue))
+        queue.append((callback, snapshot, argument))
+
+    async def _drain(self, obj: Any, queue: deque[tuple[Callable, PropertySnapshot, Any]]) -> None:
+        while queue:
+            callback, snapshot, argument = queue.popleft()
+            try:
+                result = callback(snapshot, argument)
+                if inspect.isawaitable(result):
+                    await result
+            except Exception as e:
+                print(f"[AsyncListener] Ошибка слушателя {type(self.listener).__name__}: {e}", file=sys.stderr)
+        del self._queues[obj]
+        del self._tasks[obj]
+
+    async def flush(self) -> None:
+        await asyncio.sleep(0)
+        while self._tasks:
+            await asyncio.gather(*self._tasks.values())
@@ -0,0 +1,57 @@
+from typing import Any, Iterable
+
+WILDCARD = "*"
+
+
+class ListenerIndex:
+    def __init__(self) -> None:
+        self._by_property: dict[str, dict[int, Any]] = {}
+        self._registrations: dict[int, dict[str, list[int]]] = {}
+        self._snapshots: dict[str, tuple] = {}
+        self._sequence = 0
+
+    def add(self, listener: Any, property_names: Iterable[str] = ()) -> None:
+        names = set(property_names) or {WILDCARD}
+        registrations = self._registrations.setdefault(id(listener), {})
+        for name in names:
+            self._by_property.setdefault(name, {})[self._sequence] = listener
+            registrations.setdefault(name, []).append(self._sequence)
+            self._sequence += 1
+        self._snapshots.clear()
+
+    def remove(self, listener: Any, property_names: Iterable[str] = ()) -> None:
+        registrations = self._registrations.get(id(listener))
+        if registrations is None:
+            raise ValueError(f"{listener!r} is not registered")
+        names = set(property_names) or set(registrations)
+        for name in names & registrations.keys():
+            sequences = registrations[name]
+            listeners = self._by_property[name]
+            del listeners[sequences.pop(0)]
+            if not listeners:
+                del self._by_property[name]
+            if not sequences:
+                del registrations[name]
+        if not registrations:
+            del self._registrations[id(listener)]
+        self._snapshots.clear()
+
+    def listeners_for(self, property_name: str) -> tuple:
+        snapshot = self._snapshots.get(property_name)
+        if snapshot is None:
+            specific = self._by_property.get(property_name, {})
+            wildcard = self._by_property.get(WILDCARD, {})
+            if not wildcard or property_name == WILDCARD:
+                snapshot = tuple(specific.values())
+            elif not specific:
+                snapshot = tuple(wildcard.values())
+            else:
+                snapshot = tuple(listener for _, listener in sorted([*wildcard.items(), *specific.items()]))
+            self._snapshots[property_name] = snapshot
+        return snapshot
+
+    def __bool__(self) -> bool:
+        return bool(self._registrations)
+
+    def __len__(self) -> int:
+        return len(self._registrations)
@@ -0,0 +1,196 @@
+from operator import attrgetter
+from typing import Any
+from protocols import DataChangingProtocol, PropertyChangingListenerProtocol, DataChangedProtocol, PropertyChangedListenerProtocol
+from listener_index import ListenerIndex
+
+
+class ObservableProperty:
+    def __init__(self, default: Any = None) -> None:
+        self.default = default
+        self.name = ""
+
+    def __set_name__(self, owner: type, name: str) -> None:
+        self.name = name
+
+    def compile(self) -> property:
+        name = self.name
+        slot_name = f"_{name}"
+
+        def setter(obj, value):
+            if obj._observed:
+                obj._set_observed(name, value)
+            else:
+                setattr(obj, slot_name, value)
+
+        return property(attrgetter(slot_name), setter)
+
+
+class BatchUpdate:
+    __slots__ = ('_owner', '_outer', 'changes', 'committed')
+
+    def __init__(self, owner: 'ObservableMixin') -> None:
+        self._owner = owner
+        self._outer: BatchUpdate | None = None
+        self.changes: dict[str, Any] = {}
+        self.committed = False
+
+    def __enter__(self) -> 'BatchUpdate':
+        owner = self._owner
+        self._outer = owner._batch
+        owner._batch = self
+        if self._outer is None:
+            owner._update_observed()
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        owner = self._owner
+        owner._batch = self._outer
+        if self._outer is not None:
+            if exc_type is None:
+                self._outer.changes.update(self.changes)
+            return
+        owner._update_observed()
+        if exc_type is None:
+            self.committed = owner._commit_batch(self.changes)
+
+
+class ObservableMixin(DataChangingProtocol, DataChangedProtocol):
+    __slots__ = ('_changing_listeners', '_changed_listeners', '_observed', '_batch')
+    __observable_fields__: dict[str, ObservableProperty] = {}
+
+    def __init__(self) -> None:
+        self._changing_listeners: ListenerIndex | None = None
+        self._changed_listeners: ListenerIndex | None = None
+        self._observed = False
+        self._batch: BatchUpdate | None = None
+        for name, field in self.__observable_fields__.items():
+            setattr(self, f"_{name}", field.default)
+
+    def add_property_changing_listener(self, listener: PropertyChangingListenerProtocol, *property_names: str) -> None:
+        if self._changing_listeners is None:
+            self._changing_listeners = ListenerIndex()
+        self._changing_listeners.add(listener, property_names)
+        self._observed = True
+
+    def remove_property_changing_listener(self, listener: PropertyChangingListenerProtocol, *property_names: str) -> None:
+        if self._changing_listeners is None:
+            raise ValueError(f"{listener!r} is not registered")
+        self._changing_listeners.remove(listener, property_names)
+        if not self._changing_listeners:
+            self._changing_listeners = None
+            self._update_observed()
+
+    def add_property_changed_listener(self, listener: PropertyChangedListenerProtocol, *property_names: str) -> None:
+        if self._changed_listeners is None:
+            self._changed_listeners = ListenerIndex()
+        self._changed_listeners.add(listener, property_names)
+        self._observed = True
+
+    def remove_property_changed_listener(self, listener: PropertyChangedListenerProtocol, *property_names: str) -> None:
+        if self._changed_listeners is None:
+            raise ValueError(f"{listener!r} is not registered")
+        self._changed_listeners.remove(listener, property_names)
+        if not self._changed_listeners:
+            self._changed_listeners = None
+            self._update_observed()
+
+    def batch_update(self) -> BatchUpdate:
+        return BatchUpdate(self)
+
+    def _update_observed(self) -> None:
+        self._observed = (self._batch is not None
+                          or self._changing_listeners is not None
+                          or self._changed_listeners is not None)
+
+    def _validate_property_change(self, property_name: str, old_value : Any, new_value : Any) -> bool:
+        if self._changing_listeners is None:
+            return True
+        for listener in self._changing_listeners.listeners_for(property_name):
+            if not listener.on_property_changing(self, property_name, old_value, new_value):
+                return False
+        return True
+
+    def _notify_property_changed(self, property_name: str) -> None:
+        if self._changed_listeners is None:
+            return
+        for listener in self._changed_listeners.listeners_for(property_name):
+            listener.on_property_changed(self, property_name)
+
+    def _notify_properties_changed(self, property_names: tuple[str, ...]) -> None:
+        if self._changed_listeners is None:
+            return
+        grouped: dict[int, tuple[Any, list[str]]] = {}
+        for property_name in property_names:
+            for listener in self._changed_listeners.listeners_for(property_name):
+                names = grouped.setdefault(id(listener), (listener, []))[1]
+                if property_name not in names:
+                    names.append(property_name)
+        for listener, names in grouped.values():
+            listener.on_properties_changed(self, tuple(names))
+
+    def _commit_batch(self, changes: dict[str, Any]) -> bool:
+        old_values = {name: getattr(self, f"_{name}") for name in changes}
+        changed = tuple(name for name, value in changes.items() if old_values[name] != value)
+        if not changed:
+            return True
+        for name in changed:
+            setattr(self, f"_{name}", changes[name])
+        accepted = False
+        try:
+            accepted = all(self._validate_property_change(name, old_values[name], changes[name]) for name in changed)
+        finally:
+            if not accepted:
+                for name in changed:
+                    setattr(self, f"_{name}", old_values[name])
+        if not accepted:
+            return False
+        self._notify_properties_changed(changed)
+        return True
+
+    def _set_observed(self, property_name: str, value: Any) -> None:
+        if self._batch is not None:
+            self._batch.changes[property_name] = value
+            return
+        slot_name = f"_{property_name}"
+        old_value = getattr(self, slot_name)
+        if old_value != value:
+            if self._validate_property_change(property_name, old_value, value):
+                setattr(self, slot_name, value)
+                self._notify_property_changed(property_name)
+
+
+def _rebind_class_cell(attr: Any, old: type, new: type) -> None:
+    if isinstance(attr, (classmethod, staticmethod)):
+        attr = attr.__func__
+    if isinstance(attr, property):
+        for accessor in (attr.fget, attr.fset, attr.fdel):
+            _rebind_class_cell(accessor, old, new)
+        return
+    code = getattr(attr, '__code__', None)
+    if code is None or '__class__' not in code.co_freevars:
+        return
+    cell = attr.__closure__[code.co_freevars.index('__class__')]
+    if cell.cell_contents is old:
+        cell.cell_contents = new
+
+
+def observable(cls: type) -> type:
+    fields = {name: attr for name, attr in cls.__dict__.items() if isinstance(attr, ObservableProperty)}
+    namespace = dict(cls.__dict__)
+    namespace.pop('__dict__', None)
+    namespace.pop('__weakref__', None)
+    own_slots = namespace.get('__slots__', ())
+    own_slots = (own_slots,) if isinstance(own_slots, str) else tuple(own_slots)
+    for slot_name in own_slots:
+        namespace.pop(slot_name, None)
+    namespace['__slots__'] = own_slots + tuple(f"_{name}" for name in fields)
+    inherited = {}
+    for base in reversed(cls.__mro__[1:]):
+        inherited.update(getattr(base, '__observable_fields__', {}))
+    namespace['__observable_fields__'] = {**inherited, **fields}
+    rebuilt = type(cls)(cls.__name__, cls.__bases__, namespace)
+    for attr in namespace.values():
+        _rebind_class_cell(attr, cls, rebuilt)
+    for name, field in fields.items():
+        setattr(rebuilt, name, field.compile())
+    return rebuilt
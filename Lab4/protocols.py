@@ -2,26 +2,38 @@ from typing import Any, Protocol
 
 
 class PropertyChangingListenerProtocol(Protocol):
+    __slots__ = ()
+
     def on_property_changing(self, obj : Any, property_name: str, old_value : Any, new_value : Any) -> bool:
         pass
 
 
 class DataChangingProtocol(Protocol):
-    def add_property_changing_listener(self, listener: PropertyChangingListenerProtocol) -> None:
+    __slots__ = ()
+
+    def add_property_changing_listener(self, listener: PropertyChangingListenerProtocol, *property_names: str) -> None:
         pass
 
-    def remove_property_changing_listener(self, listener: PropertyChangingListenerProtocol) -> None:
+    def remove_property_changing_listener(self, listener: PropertyChangingListenerProtocol, *property_names: str) -> None:
         pass
 
 
 class PropertyChangedListenerProtocol(Protocol):
+    __slots__ = ()
+
     def on_property_changed(self, obj : Any, property_name: str) -> None:
         pass
 
+    def on_properties_changed(self, obj : Any, property_names: tuple[str, ...]) -> None:
+        for property_name in property_names:
+            self.on_property_changed(obj, property_name)
+
 
 class DataChangedProtocol(Protocol):
-    def add_property_changed_listener(self, listener: PropertyChangedListenerProtocol) -> None:
+    __slots__ = ()
+
+    def add_property_changed_listener(self, listener: PropertyChangedListenerProtocol, *property_names: str) -> None:
         pass
 
-    def remove_property_changed_listener(self, listener: PropertyChangedListenerProtocol) -> None:
+    def remove_property_changed_listener(self, listener: PropertyChangedListenerProtocol, *property_names: str) -> None:
         pass
\ No newline at end of file
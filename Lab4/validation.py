@@ -0,0 +1,157 @@
+import re
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import Any, Callable, Protocol
+from protocols import DataChangingProtocol, PropertyChangingListenerProtocol
+
+
+@dataclass(frozen=True, slots=True)
+class ValidationResult:
+    property_name: str
+    value: Any
+    rule: str | None = None
+    message: str | None = None
+    source: str = ""
+
+    @property
+    def ok(self) -> bool:
+        return self.rule is None
+
+
+class Rule(Protocol):
+    message: str
+
+    def expression(self, value: str, bind: Callable[[Any], str]) -> str:
+        pass
+
+
+@dataclass(frozen=True)
+class IsInstance(Rule):
+    types: type | tuple[type, ...]
+    message: str = "Неверный тип значения"
+
+    def expression(self, value: str, bind: Callable[[Any], str]) -> str:
+        return f"isinstance({value}, {bind(self.types)})"
+
+
+@dataclass(frozen=True)
+class Length(Rule):
+    min_length: int = 0
+    max_length: int | None = None
+    message: str = "Недопустимая длина значения"
+
+    def expression(self, value: str, bind: Callable[[Any], str]) -> str:
+        if self.max_length is None:
+            return f"{self.min_length} <= len({value})"
+        return f"{self.min_length} <= len({value}) <= {self.max_length}"
+
+
+@dataclass(frozen=True)
+class Charset(Rule):
+    allowed: str | Callable[[str], bool]
+    message: str = "Недопустимые символы"
+
+    def expression(self, value: str, bind: Callable[[Any], str]) -> str:
+        if callable(self.allowed):
+            return f"{bind(self.allowed)}({value})"
+        pattern = re.compile(f"[{re.escape(self.allowed)}]*")
+        return f"{bind(pattern.fullmatch)}({value}) is not None"
+
+
+@dataclass(frozen=True)
+class Regex(Rule):
+    pattern: str | re.Pattern
+    message: str = "Значение не соответствует шаблону"
+
+    def expression(self, value: str, bind: Callable[[Any], str]) -> str:
+        return f"{bind(re.compile(self.pattern).fullmatch)}({value}) is not None"
+
+
+@dataclass(frozen=True)
+class Custom(Rule):
+    predicate: Callable[[Any], bool]
+    message: str = "Значение не прошло проверку"
+
+    def expression(self, value: str, bind: Callable[[Any], str]) -> str:
+        return f"{bind(self.predicate)}({value})"
+
+
+def compile_rules(rules: tuple[Rule, ...]) -> Callable[[Any], int]:
+    namespace: dict[str, Any] = {}
+
+    def bind(obj: Any) -> str:
+        name = f"_c{len(namespace)}"
+        namespace[name] = obj
+        return name
+
+    lines = ["def check(value):"]
+    for index, rule in enumerate(rules):
+        lines.append(f"    if not ({rule.expression('value', bind)}):")
+        lines.append(f"        return {index}")
+    lines.append("    return -1")
+    exec("\n".join(lines), namespace)
+    return namespace['check']
+
+
+class RuleSet:
+    def __init__(self, *rules: Rule, cache_size: int = 0) -> None:
+        if cache_size < 0:
+            raise ValueError("Размер кэша не может быть отрицательным")
+        self.rules = rules
+        self.cache_size = cache_size
+        self._compiled = compile_rules(rules)
+        if cache_size:
+            self._cached = lru_cache(cache_size, typed=True)(self._compiled)
+            self.check = self._check_cached
+        else:
+            self.check = self._compiled
+
+    def _check_cached(self, value: Any) -> int:
+        try:
+            return self._cached(value)
+        except TypeError:
+            return self._compiled(value)
+
+    @property
+    def hits(self) -> int:
+        return self._cached.cache_info().hits if self.cache_size else 0
+
+    @property
+    def misses(self) -> int:
+        return self._cached.cache_info().misses if self.cache_size else 0
+
+    def result(self, value: Any, verdict: int, property_name: str = "", source: str = "") -> ValidationResult:
+        if verdict < 0:
+            return ValidationResult(property_name, value, source=source)
+        rule = self.rules[verdict]
+        return ValidationResult(property_name, value, type(rule).__name__, rule.message, source)
+
+    def validate(self, value: Any, property_name: str = "", source: str = "") -> ValidationResult:
+        return self.result(value, self.check(value), property_name, source)
+
+
+class RuleValidator(PropertyChangingListenerProtocol):
+    def __init__(self, rules: dict[str, RuleSet],
+                 on_failure: Callable[[ValidationResult], None] | None = None) -> None:
+        self.rules = rules
+        self.on_failure = on_failure
+        self._last_failure: tuple[RuleSet, Any, int, str] | None = None
+
+    @property
+    def last_failure(self) -> ValidationResult | None:
+        if self._last_failure is None:
+            return None
+        rule_set, value, verdict, property_name = self._last_failure
+        return rule_set.result(value, verdict, property_name, type(self).__name__)
+
+    def on_property_changing(self, obj : DataChangingProtocol, property_name: str, old_value : Any, new_value : Any) -> bool:
+        rule_set = self.rules.get(property_name)
+        if rule_set is None:
+            return True
+        verdict = rule_set.check(new_value)
+        if verdict < 0:
+            return True
+        self._last_failure = (rule_set, new_value, verdict, property_name)
+        if self.on_failure is not None:
+            self.on_failure(self.last_failure)
+        return False
@@ -1,10 +1,10 @@
-from user_repository import UserRepository
+from user_repository import CachedUserRepository
 from user import User
 from auth_service import AuthService
 from serializers import JSONSerializer
 
 def demo():
-    user_repo = UserRepository("data/users.json", JSONSerializer())
+    user_repo = CachedUserRepository("data/users.json", JSONSerializer())
     auth_service = AuthService(user_repo, "data/session.txt")
 
     users = [
@@ -12,9 +12,8 @@ def demo():
         User(id = 1, login = "login", password = "pass", name = "Name", email = "NameDigits@example.com", address="example street")
              ]
 
-    for user in users:
-        if not user_repo.get_by_id(user.id):
-            user_repo.add(user)
+    existing = user_repo.get_many(user.id for user in users)
+    user_repo.add_many(user for user, found in zip(users, existing) if found is None)
 
     print("Авторизация с неверными данными:")
     try:
@@ -38,7 +37,7 @@ def demo():
 
 
 def demo2():
-    user_repo = UserRepository("data/users.json", JSONSerializer())
+    user_repo = CachedUserRepository("data/users.json", JSONSerializer())
     auth_service = AuthService(user_repo, "data/session.txt")
 
     if auth_service.is_authorized:
@@ -0,0 +1,40 @@
+import os
+import sys
+import tempfile
+import time
+from serializers import JSONSerializer
+from user import User
+from user_repository import UserRepository, LogUserRepository
+
+UPDATES = 200
+
+
+def seed(filename: str, users: int) -> None:
+    UserRepository(filename, JSONSerializer())._save_data(
+        [User(id=i, login=f"login{i}", password="pass", name=f"Name{i}") for i in range(users)])
+
+
+def measure(repository, users: int) -> float:
+    start = time.perf_counter()
+    for i in range(UPDATES):
+        user_id = i * 7919 % users
+        repository.update(User(id=user_id, login=f"login{user_id}", password="pass", name=f"Updated{i}"))
+    return time.perf_counter() - start
+
+
+def main():
+    sizes = [int(arg) for arg in sys.argv[1:]] or [1_000, 10_000]
+    print(f"{UPDATES} x update")
+    print(f"{'пользователей':>14}{'JSON-файл, с':>14}{'журнал, с':>12}{'ускорение':>12}")
+    for users in sizes:
+        with tempfile.TemporaryDirectory() as directory:
+            filename = os.path.join(directory, "users.json")
+            seed(filename, users)
+            rewrite = measure(UserRepository(filename, JSONSerializer()), users)
+            with LogUserRepository(filename, JSONSerializer()) as repository:
+                log = measure(repository, users)
+            print(f"{users:>14}{rewrite:>14.3f}{log:>12.4f}{rewrite / log:>11.0f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,41 @@
+import os
+import sys
+import tempfile
+import time
+from auth_service import AuthService
+from serializers import JSONSerializer
+from user import User
+from user_repository import UserRepository, CachedUserRepository
+
+LOOKUPS = 200
+
+
+def measure(repository, users: int) -> float:
+    auth_file = os.path.join(os.path.dirname(repository.filename), "session.txt")
+    auth_service = AuthService(repository, auth_file)
+    start = time.perf_counter()
+    for i in range(LOOKUPS):
+        user_id = i * 7919 % users
+        repository.get_by_id(user_id)
+        auth_service.sign_in(f"login{user_id}", "pass")
+    return time.perf_counter() - start
+
+
+def main():
+    sizes = [int(arg) for arg in sys.argv[1:]] or [1_000, 10_000]
+    print(f"{LOOKUPS} x (get_by_id + sign_in)")
+    print(f"{'пользователей':>14}{'файл, с':>10}{'кэш, с':>10}{'ускорение':>12}")
+    for users in sizes:
+        with tempfile.TemporaryDirectory() as directory:
+            filename = os.path.join(directory, "users.json")
+            UserRepository(filename, JSONSerializer())._save_data(
+                [User(id=i, login=f"login{i}", password="pass", name=f"Name{i}") for i in range(users)])
+            plain = measure(UserRepository(filename, JSONSerializer()), users)
+            cached_repository = CachedUserRepository(filename, JSONSerializer())
+            cached = measure(cached_repository, users)
+            print(f"{users:>14}{plain:>10.3f}{cached:>10.3f}{plain / cached:>11.0f}x"
+                  f"  (попаданий {cached_repository.hits}, промахов {cached_repository.misses})")
+
+
+if __name__ == "__main__":
+    main()
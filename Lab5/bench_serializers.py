@@ -0,0 +1,48 @@
+import io
+import sys
+import time
+from serializers import BinarySerializer, JSONLinesSerializer, JSONSerializer
+from user import User
+
+
+def make_users(count: int) -> list[User]:
+    return [User(id=i, login=f"login{i}", password="pass", name=f"Name{i}",
+                 email=f"user{i}@example.com" if i % 2 else None, address=None)
+            for i in range(count)]
+
+
+def timed(func, *args):
+    start = time.perf_counter()
+    result = func(*args)
+    return result, time.perf_counter() - start
+
+
+def measure_stream(serializer, users: list[User]) -> tuple[float, float]:
+    stream = io.BytesIO()
+    _, dump = timed(serializer.dump, users, stream)
+    stream.seek(0)
+    _, load = timed(lambda: sum(1 for _ in serializer.load(stream)))
+    return dump, load
+
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 100_000
+    users = make_users(count)
+    print(f"{count} пользователей")
+    print(f"{'':<14}{'размер, КБ':>12}{'запись, с':>12}{'чтение, с':>12}{'поток: запись, с':>19}{'чтение, с':>12}")
+    for name, serializer in (("JSON", JSONSerializer()),
+                             ("JSON Lines", JSONLinesSerializer(User)),
+                             ("Binary", BinarySerializer(User))):
+        data, serialize = timed(serializer.serialize, users)
+        restored, deserialize = timed(serializer.deserialize, data)
+        assert [(u.id, u.email) for u in restored] == [(u.id, u.email) for u in users]
+        if hasattr(serializer, 'dump'):
+            dump, load = measure_stream(serializer, users)
+            stream = f"{dump:>19.3f}{load:>12.3f}"
+        else:
+            stream = f"{'-':>19}{'-':>12}"
+        print(f"{name:<14}{len(data) / 1024:>12.0f}{serialize:>12.3f}{deserialize:>12.3f}{stream}")
+
+
+if __name__ == "__main__":
+    main()
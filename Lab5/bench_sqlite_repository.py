@@ -0,0 +1,54 @@
+import os
+import sys
+import tempfile
+import time
+from serializers import JSONSerializer
+from sqlite_repository import SqliteUserRepository
+from user import User
+from user_repository import UserRepository
+
+
+def make_users(count: int) -> list[User]:
+    return [User(id=i, login=f"login{i}", password="pass", name=f"Name{i}") for i in range(count)]
+
+
+def measure(repository, users: int, operations: int) -> tuple[float, float]:
+    start = time.perf_counter()
+    for i in range(operations):
+        user_id = i * 7919 % users
+        repository.get_by_id(user_id)
+        repository.get_by_login(f"login{user_id}")
+    lookup = (time.perf_counter() - start) / (2 * operations)
+    start = time.perf_counter()
+    for i in range(operations):
+        user_id = i * 7919 % users
+        repository.update(User(id=user_id, login=f"login{user_id}", password="pass", name=f"Updated{i}"))
+    update = (time.perf_counter() - start) / operations
+    return lookup, update
+
+
+def main():
+    sizes = [int(arg) for arg in sys.argv[1:]] or [1_000, 100_000, 1_000_000]
+    print(f"{'пользователей':>14}{'':>8}{'загрузка, с':>13}{'поиск, мс':>12}{'изменение, мс':>16}")
+    for users in sizes:
+        with tempfile.TemporaryDirectory() as directory:
+            data = make_users(users)
+
+            json_repository = UserRepository(os.path.join(directory, "users.json"), JSONSerializer())
+            start = time.perf_counter()
+            json_repository._save_data(data)
+            json_seed = time.perf_counter() - start
+            json_lookup, json_update = measure(json_repository, users, max(2, min(200, 200_000 // users)))
+
+            with SqliteUserRepository(os.path.join(directory, "users.db")) as sqlite_repository:
+                start = time.perf_counter()
+                sqlite_repository.add_many(data)
+                sqlite_seed = time.perf_counter() - start
+                sqlite_lookup, sqlite_update = measure(sqlite_repository, users, 2_000)
+
+            print(f"{users:>14}{'JSON':>8}{json_seed:>13.2f}{json_lookup * 1000:>12.3f}{json_update * 1000:>16.3f}")
+            print(f"{'':>14}{'SQLite':>8}{sqlite_seed:>13.2f}{sqlite_lookup * 1000:>12.3f}{sqlite_update * 1000:>16.3f}")
+
+
+if __name__ == "__main__":
+    main()
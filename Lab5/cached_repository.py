@@ -0,0 +1,74 @@
+import copy
+import os
+from typing import Any, Iterable, Optional, Sequence
+from data_repository import DataRepository, T
+from serializers import ISerializer
+
+
+class CachedDataRepository(DataRepository[T]):
+    def __init__(self, filename: str, serializer : ISerializer, index_fields: Sequence[str] = ('id',)) -> None:
+        super().__init__(filename, serializer)
+        self.index_fields = tuple(index_fields)
+        self.hits = 0
+        self.misses = 0
+        self._items: list[T] = []
+        self._indexes: dict[str, dict[Any, T]] = {name: {} for name in self.index_fields}
+        self._signature: tuple[int, int] | None = None
+        self._loaded = False
+
+    def _file_signature(self) -> tuple[int, int] | None:
+        try:
+            stat = os.stat(self.filename)
+        except FileNotFoundError:
+            return None
+        return stat.st_mtime_ns, stat.st_size
+
+    def _rebuild(self, items: list[T]) -> None:
+        self._items = items
+        self._indexes = {name: {getattr(item, name): item for item in reversed(items)} for name in self.index_fields}
+
+    def _refresh(self) -> None:
+        signature = self._file_signature()
+        if self._loaded and signature == self._signature:
+            self.hits += 1
+            return
+        self.misses += 1
+        self._rebuild(super()._load_data())
+        self._signature = signature
+        self._loaded = True
+
+    def invalidate(self) -> None:
+        self._loaded = False
+
+    def _load_data(self) -> list[T]:
+        self._refresh()
+        return list(self._items)
+
+    def _save_data(self, data: list[T]) -> None:
+        super()._save_data(data)
+        self._rebuild([copy.copy(item) for item in data])
+        self._signature = self._file_signature()
+        self._loaded = True
+
+    def get_all(self) -> Sequence[T]:
+        self._refresh()
+        return [copy.copy(item) for item in self._items]
+
+    def get_by_id(self, id: int) -> Optional[T]:
+        return self.find_by('id', id)
+
+    def get_many(self, ids: Iterable[int]) -> list[Optional[T]]:
+        self._refresh()
+        index = self._indexes.get('id')
+        if index is None:
+            return super().get_many(ids)
+        return [copy.copy(item) if item is not None else None for item in map(index.get, ids)]
+
+    def find_by(self, field_name: str, value: Any) -> Optional[T]:
+        self._refresh()
+        index = self._indexes.get(field_name)
+        if index is None:
+            item = next((item_ for item_ in self._items if getattr(item_, field_name) == value), None)
+        else:
+            item = index.get(value)
+        return copy.copy(item) if item is not None else None
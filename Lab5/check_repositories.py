@@ -0,0 +1,147 @@
+import os
+import sqlite3
+import sys
+import tempfile
+from dataclasses import astuple
+from typing import Any, Callable
+from auth_service import AuthService
+from serializers import BinarySerializer, JSONSerializer
+from sqlite_repository import SqliteUserRepository
+from user import User
+from user_repository import CachedUserRepository, IUserRepository, LogUserRepository, UserRepository
+
+BACKENDS: dict[str, Callable[[str], IUserRepository]] = {
+    "JSON": lambda directory: UserRepository(os.path.join(directory, "users.json"), JSONSerializer()),
+    "JSON + кэш": lambda directory: CachedUserRepository(os.path.join(directory, "users.json"), JSONSerializer()),
+    "журнал": lambda directory: LogUserRepository(os.path.join(directory, "users.bin"), BinarySerializer(User)),
+    "SQLite": lambda directory: SqliteUserRepository(os.path.join(directory, "users.db")),
+}
+
+USERS = [
+    User(id=0, login="admin", password="admin123", name="Admin"),
+    User(id=1, login="login", password="pass", name="Name", email="NameDigits@example.com", address="example street"),
+    User(id=2, login="guest", password="guest", name="guest"),
+]
+
+
+def attempt(action: Callable[[], Any]) -> Any:
+    try:
+        return action()
+    except ValueError as e:
+        return f"ValueError: {e}"
+
+
+def dump(users) -> Any:
+    if users is None:
+        return None
+    if isinstance(users, User):
+        return astuple(users)
+    return [dump(user) for user in users]
+
+
+def close(repository: IUserRepository) -> None:
+    close_repository = getattr(repository, 'close', None)
+    if close_repository is not None:
+        close_repository()
+
+
+def scenario(factory: Callable[[str], IUserRepository], directory: str) -> list[tuple[str, Any]]:
+    steps = []
+    repository = factory(directory)
+
+    def step(name: str, action: Callable[[], Any]) -> None:
+        steps.append((name, attempt(action)))
+
+    existing = repository.get_many(user.id for user in USERS)
+    step("заполнение", lambda: repository.add_many(user for user, found in zip(USERS, existing) if found is None))
+    step("повторное заполнение", lambda: repository.add_many(USERS))
+    step("все", lambda: dump(repository.get_all()))
+    step("id по убыванию", lambda: repository.add_many([User(id=8, login="dup", password="p", name="Eight"),
+                                                        User(id=7, login="dup", password="p", name="Seven"),
+                                                        User(id=6, login="six", password="p", name="Six")]))
+    step("порядок добавления", lambda: [user.id for user in repository.get_all()])
+    step("первый с повторным логином", lambda: dump(repository.get_by_login("dup")))
+    step("переименование в повторный логин", lambda: repository.update(User(id=6, login="dup", password="p", name="Six")))
+    step("после переименования", lambda: dump(repository.get_by_login("dup")))
+    step("удаление первого с логином", lambda: repository.delete_many([User(id=8, login="dup", password="p", name="Eight")]))
+    step("после удаления первого", lambda: dump(repository.get_by_login("dup")))
+    step("уход с повторного логина", lambda: repository.update(User(id=7, login="seven", password="p", name="Seven")))
+    step("после ухода", lambda: dump(repository.get_by_login("dup")))
+    step("очистка", lambda: repository.delete_many([User(id=id, login="", password="", name="") for id in (6, 7)]))
+    step("по логину", lambda: dump(repository.get_by_login("login")))
+    step("по неизвестному логину", lambda: dump(repository.get_by_login("nobody")))
+    step("по неизвестному id", lambda: dump(repository.get_by_id(42)))
+
+    auth_service = AuthService(repository, os.path.join(directory, "session.txt"))
+    step("вход с неверными данными", lambda: auth_service.sign_in("login", "wrong"))
+    step("вход", lambda: auth_service.sign_in("login", "pass"))
+    step("текущий пользователь", lambda: dump(auth_service.current_user))
+    user = auth_service.current_user
+    user.name = "aaa"
+    step("изменение имени", lambda: repository.update(user))
+    step("после изменения", lambda: dump(repository.get_by_id(user.id)))
+    step("изменение отсутствующего", lambda: repository.update(User(id=42, login="x", password="x", name="x")))
+
+    step("пакет с конфликтом", lambda: repository.add_many([User(id=3, login="new", password="p", name="New"), USERS[0]]))
+    step("после конфликта", lambda: dump(repository.get_by_id(3)))
+    step("повтор id в пакете", lambda: repository.add_many([User(id=4, login="a", password="p", name="A")] * 2))
+    step("пакетное изменение с отсутствующим",
+         lambda: repository.update_many([User(id=0, login="admin", password="admin123", name="Root"),
+                                         User(id=42, login="x", password="x", name="x")]))
+    step("после пакетного изменения", lambda: dump(repository.get_by_id(0)))
+    step("upsert", lambda: repository.upsert_many([User(id=2, login="guest", password="guest", name="Guest"),
+                                                    User(id=5, login="five", password="p", name="Five")]))
+    step("get_many", lambda: dump(repository.get_many([5, 42, 2, 5])))
+    step("пустой пакет", lambda: repository.add_many([]))
+    step("пакетное удаление", lambda: repository.delete_many([USERS[2], User(id=42, login="x", password="x", name="x")]))
+    step("удаление", lambda: repository.delete(USERS[0]))
+    step("повторное удаление", lambda: repository.delete(USERS[0]))
+    step("по имени", lambda: dump(sorted(repository.get_all())))
+    close(repository)
+
+    repository = factory(directory)
+    step("после переоткрытия", lambda: dump(repository.get_all()))
+    auth_service = AuthService(repository, os.path.join(directory, "session.txt"))
+    step("восстановленная сессия", lambda: dump(auth_service.current_user))
+    close(repository)
+    return steps
+
+
+def check_sqlite_constraints(directory: str) -> bool:
+    with SqliteUserRepository(os.path.join(directory, "constraints.db")) as repository:
+        try:
+            repository.add(User(id=1, login="login", password="pass", name=None))
+        except sqlite3.IntegrityError:
+            return True
+        except ValueError:
+            return False
+    return False
+
+
+def main():
+    results = {}
+    for name, factory in BACKENDS.items():
+        with tempfile.TemporaryDirectory() as directory:
+            results[name] = scenario(factory, directory)
+
+    reference_name, reference = next(iter(results.items()))
+    failures = 0
+    for name, steps in results.items():
+        mismatches = [(step, expected, actual)
+                      for (step, expected), (_, actual) in zip(reference, steps) if expected != actual]
+        print(f"{name:>12}: {len(steps)} шагов, расхождений с {reference_name}: {len(mismatches)}")
+        for step, expected, actual in mismatches:
+            print(f"{'':>14}{step}: ожидалось {expected!r}, получено {actual!r}")
+        failures += len(mismatches)
+
+    with tempfile.TemporaryDirectory() as directory:
+        constraints_ok = check_sqlite_constraints(directory)
+    print(f"SQLite: нарушение NOT NULL не выдаётся за дубликат: {'да' if constraints_ok else 'нет'}")
+    if not constraints_ok:
+        failures += 1
+
+    sys.exit(1 if failures else 0)
+
+
+if __name__ == "__main__":
+    main()
@@ -1,4 +1,4 @@
-from typing import Protocol, Sequence, TypeVar, Optional
+from typing import Iterable, Protocol, Sequence, TypeVar, Optional
 from serializers import ISerializer
 T = TypeVar('T')
 
@@ -19,6 +19,30 @@ class IDataRepository(Protocol[T]):
     def delete(self, item: T) -> None:
         pass
 
+    def get_many(self, ids: Iterable[int]) -> list[Optional[T]]:
+        pass
+
+    def add_many(self, items: Iterable[T]) -> None:
+        pass
+
+    def update_many(self, items: Iterable[T]) -> None:
+        pass
+
+    def upsert_many(self, items: Iterable[T]) -> None:
+        pass
+
+    def delete_many(self, items: Iterable[T]) -> None:
+        pass
+
+
+def index_by_id(items: Iterable[T]) -> dict[int, T]:
+    batch = {}
+    for item in items:
+        if item.id in batch:
+            raise ValueError(f"Duplicate id: {item.id}")
+        batch[item.id] = item
+    return batch
+
 
 class DataRepository(IDataRepository[T]):
     def __init__(self, filename: str, serializer : ISerializer) -> None:
@@ -43,20 +67,58 @@ class DataRepository(IDataRepository[T]):
         return next((item_ for item_ in self.get_all() if item_.id == id), None)
 
     def add(self, item: T) -> None:
+        self.add_many((item,))
+
+    def update(self, item: T) -> None:
+        self.update_many((item,))
+
+    def delete(self, item: T) -> None:
+        self.delete_many((item,))
+
+    def get_many(self, ids: Iterable[int]) -> list[Optional[T]]:
+        by_id = {item_.id: item_ for item_ in reversed(self.get_all())}
+        return [by_id.get(id) for id in ids]
+
+    def add_many(self, items: Iterable[T]) -> None:
+        batch = index_by_id(items)
+        if not batch:
+            return
         data = self._load_data()
-        data.append(item)
+        if any(item_.id in batch for item_ in data):
+            raise ValueError("Item already exists")
+        data.extend(batch.values())
         self._save_data(data)
 
-    def update(self, item: T) -> None:
+    def update_many(self, items: Iterable[T]) -> None:
+        batch = index_by_id(items)
+        if not batch:
+            return
         data = self._load_data()
-        index = next((i for i, u in enumerate(data) if u.id == item.id), None)
-        if index is not None:
-            data[index] = item
-            self._save_data(data)
-        else:
+        if len(self._replace(data, batch)) != len(batch):
             raise ValueError("Item not found")
+        self._save_data(data)
 
-    def delete(self, item: T) -> None:
+    def upsert_many(self, items: Iterable[T]) -> None:
+        batch = index_by_id(items)
+        if not batch:
+            return
+        data = self._load_data()
+        replaced = self._replace(data, batch)
+        data.extend(item for id, item in batch.items() if id not in replaced)
+        self._save_data(data)
+
+    def delete_many(self, items: Iterable[T]) -> None:
+        ids = {item.id for item in items}
+        if not ids:
+            return
         data = self._load_data()
-        data = [item_ for item_ in data if item_.id != item.id]
-        self._save_data(data)
\ No newline at end of file
+        self._save_data([item_ for item_ in data if item_.id not in ids])
+
+    @staticmethod
+    def _replace(data: list[T], batch: dict[int, T]) -> set[int]:
+        replaced = set()
+        for i, item_ in enumerate(data):
+            if item_.id in batch:
+                data[i] = batch[item_.id]
+                replaced.add(item_.id)
+        return replaced
@@ -0,0 +1,253 @@
+import copy
+import os
+import shutil
+import struct
+import sys
+import threading
+import zlib
+from typing import Any, Iterable, Iterator, Optional, Sequence
+from data_repository import IDataRepository, T, index_by_id
+from serializers import ISerializer
+
+PUT = 1
+DELETE = 2
+BATCH = 3
+HEADER = struct.Struct('<BII')
+DELETE_PAYLOAD = struct.Struct('<q')
+
+
+def make_frame(op: int, payload: bytes) -> bytes:
+    return HEADER.pack(op, len(payload), zlib.crc32(payload, op)) + payload
+
+
+def iter_frames(data: bytes) -> Iterator[tuple[int, bytes, int]]:
+    offset = 0
+    while offset + HEADER.size <= len(data):
+        op, length, checksum = HEADER.unpack_from(data, offset)
+        start = offset + HEADER.size
+        payload = data[start:start + length]
+        if len(payload) < length or zlib.crc32(payload, op) != checksum:
+            return
+        offset = start + length
+        yield op, payload, offset
+
+
+class LogDataRepository(IDataRepository[T]):
+    def __init__(self, filename: str, serializer : ISerializer, index_fields: Sequence[str] = (),
+                 compact_threshold: int = 1 << 20, fsync: bool = False) -> None:
+        self.filename = filename
+        self.serializer = serializer
+        self.log_filename = f"{filename}.log"
+        self.index_fields = tuple(index_fields)
+        self.compact_threshold = compact_threshold
+        self.fsync = fsync
+        self.compactions = 0
+        self._compacting_filename = f"{filename}.log.compacting"
+        self._items: dict[int, T] = {}
+        self._indexes: dict[str, dict[Any, set[int]]] = {name: {} for name in self.index_fields}
+        self._lock = threading.RLock()
+        self._compactor: threading.Thread | None = None
+        self._open()
+
+    def _open(self) -> None:
+        try:
+            with open(self.filename, 'rb') as f:
+                for item in self.serializer.deserialize(f.read()):
+                    self._put(item)
+        except FileNotFoundError:
+            pass
+        if os.path.exists(self._compacting_filename):
+            self._replay(self._compacting_filename, truncate=False)
+            self._write_snapshot(list(self._items.values()))
+        self._log_size = self._replay(self.log_filename, truncate=True)
+        self._log = open(self.log_filename, 'ab')
+
+    def _replay(self, path: str, truncate: bool) -> int:
+        try:
+            with open(path, 'rb') as f:
+                data = f.read()
+        except FileNotFoundError:
+            return 0
+        offset = 0
+        for op, payload, offset in iter_frames(data):
+            self._apply(op, payload)
+        if truncate and offset < len(data):
+            with open(path, 'r+b') as f:
+                f.truncate(offset)
+        return offset
+
+    def _apply(self, op: int, payload: bytes) -> None:
+        if op == PUT:
+            self._put(self.serializer.deserialize(payload)[0])
+        elif op == DELETE:
+            self._remove(DELETE_PAYLOAD.unpack(payload)[0])
+        elif op == BATCH:
+            for inner_op, inner_payload, _ in iter_frames(payload):
+                self._apply(inner_op, inner_payload)
+        else:
+            raise ValueError(f"Unknown log record type: {op}")
+
+    def _put(self, item: T) -> None:
+        old = self._items.get(item.id)
+        if old is not None:
+            self._unindex(old)
+        self._items[item.id] = item
+        for name, index in self._indexes.items():
+            index.setdefault(getattr(item, name), set()).add(item.id)
+
+    def _remove(self, id: int) -> None:
+        item = self._items.pop(id, None)
+        if item is not None:
+            self._unindex(item)
+
+    def _unindex(self, item: T) -> None:
+        for name, index in self._indexes.items():
+            key = getattr(item, name)
+            ids = index[key]
+            ids.discard(item.id)
+            if not ids:
+                del index[key]
+
+    def _append(self, records: list[tuple[int, bytes]]) -> None:
+        frame = b"".join(make_frame(op, payload) for op, payload in records)
+        if len(records) > 1:
+            frame = make_frame(BATCH, frame)
+        self._log.write(frame)
+        self._log.flush()
+        if self.fsync:
+            os.fsync(self._log.fileno())
+        self._log_size += len(frame)
+
+    def _compact_if_needed(self) -> None:
+        if self._log_size >= self.compact_threshold:
+            self.compact(wait=False)
+
+    def get_all(self) -> Sequence[T]:
+        with self._lock:
+            return [copy.copy(item) for item in self._items.values()]
+
+    def get_by_id(self, id: int) -> Optional[T]:
+        item = self._items.get(id)
+        return copy.copy(item) if item is not None else None
+
+    def find_by(self, field_name: str, value: Any) -> Optional[T]:
+        with self._lock:
+            index = self._indexes.get(field_name)
+            if index is None:
+                item = next((item_ for item_ in self._items.values() if getattr(item_, field_name) == value), None)
+            else:
+                item = self._items.get(self._first(index.get(value, ())))
+            return copy.copy(item) if item is not None else None
+
+    def _first(self, ids: set[int]) -> Optional[int]:
+        if len(ids) <= 1:
+            return next(iter(ids), None)
+        return next(id for id in self._items if id in ids)
+
+    def get_many(self, ids: Iterable[int]) -> list[Optional[T]]:
+        with self._lock:
+            return [copy.copy(item) if item is not None else None for item in map(self._items.get, ids)]
+
+    def add(self, item: T) -> None:
+        self.add_many((item,))
+
+    def update(self, item: T) -> None:
+        self.update_many((item,))
+
+    def delete(self, item: T) -> None:
+        self.delete_many((item,))
+
+    def add_many(self, items: Iterable[T]) -> None:
+        batch = index_by_id(items)
+        with self._lock:
+            if any(id in self._items for id in batch):
+                raise ValueError("Item already exists")
+            self._store(batch.values())
+
+    def update_many(self, items: Iterable[T]) -> None:
+        batch = index_by_id(items)
+        with self._lock:
+            if not all(id in self._items for id in batch):
+                raise ValueError("Item not found")
+            self._store(batch.values())
+
+    def upsert_many(self, items: Iterable[T]) -> None:
+        batch = index_by_id(items)
+        with self._lock:
+            self._store(batch.values())
+
+    def delete_many(self, items: Iterable[T]) -> None:
+        with self._lock:
+            ids = [id for id in dict.fromkeys(item.id for item in items) if id in self._items]
+            if not ids:
+                return
+            self._append([(DELETE, DELETE_PAYLOAD.pack(id)) for id in ids])
+            for id in ids:
+                self._remove(id)
+            self._compact_if_needed()
+
+    def _store(self, items: Iterable[T]) -> None:
+        stored = [copy.copy(item) for item in items]
+        if not stored:
+            return
+        self._append([(PUT, self.serializer.serialize([item])) for item in stored])
+        for item in stored:
+            self._put(item)
+        self._compact_if_needed()
+
+    def compact(self, wait: bool = True) -> None:
+        with self._lock:
+            compactor = self._compactor
+            if compactor is None or not compactor.is_alive():
+                if not self._log_size:
+                    return
+                self._log.close()
+                self._rotate_log()
+                self._log = open(self.log_filename, 'ab')
+                self._log_size = 0
+                compactor = self._compactor = threading.Thread(
+                    target=self._run_compaction, args=(list(self._items.values()),),
+                    name="LogCompactor", daemon=True)
+                compactor.start()
+        if wait:
+            compactor.join()
+
+    def _rotate_log(self) -> None:
+        if not os.path.exists(self._compacting_filename):
+            os.replace(self.log_filename, self._compacting_filename)
+            return
+        with open(self.log_filename, 'rb') as source, open(self._compacting_filename, 'ab') as target:
+            shutil.copyfileobj(source, target)
+            target.flush()
+            os.fsync(target.fileno())
+        os.remove(self.log_filename)
+
+    def _run_compaction(self, items: list[T]) -> None:
+        try:
+            self._write_snapshot(items)
+        except Exception as e:
+            print(f"[LogDataRepository] Compaction failed: {e}", file=sys.stderr)
+
+    def _write_snapshot(self, items: list[T]) -> None:
+        temporary = f"{self.filename}.tmp"
+        with open(temporary, 'wb') as f:
+            f.write(self.serializer.serialize(items))
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(temporary, self.filename)
+        os.remove(self._compacting_filename)
+        self.compactions += 1
+
+    def close(self) -> None:
+        with self._lock:
+            compactor = self._compactor
+        if compactor is not None:
+            compactor.join()
+        with self._lock:
+            self._log.close()
+
+    def __enter__(self) -> 'LogDataRepository[T]':
+        return self
+
+    def __exit__(self, *args) -> None:
+        self.close()
@@ -1,6 +1,10 @@
-from typing import Protocol
+from typing import BinaryIO, Iterable, Iterator, Protocol, Union, get_args, get_origin, get_type_hints
+import io
 import json
-from dataclasses import asdict, is_dataclass
+import struct
+import types
+from dataclasses import asdict, fields, is_dataclass
+from operator import attrgetter
 from user import User
 
 class ISerializer(Protocol):
@@ -30,4 +34,157 @@ class JSONSerializer(ISerializer):
             return []
         data_json = data_bytes.decode('utf-8')
         data_list = json.loads(data_json)
-        return [User(**item) for item in data_list]
\ No newline at end of file
+        return [User(**item) for item in data_list]
+
+
+class IStreamSerializer(ISerializer, Protocol):
+    def dump(self, items: Iterable, stream: BinaryIO) -> None:
+        pass
+
+    def load(self, stream: BinaryIO) -> Iterator:
+        pass
+
+
+class JSONLinesSerializer(IStreamSerializer):
+    def __init__(self, item_type: type = User) -> None:
+        self.item_type = item_type
+        self._names = tuple(field_.name for field_ in fields(item_type))
+        getter = attrgetter(*self._names)
+        self._values = getter if len(self._names) > 1 else lambda item: (getter(item),)
+        self._encoder = json.JSONEncoder(ensure_ascii=False)
+
+    def _encode(self, item) -> bytes:
+        return (self._encoder.encode(dict(zip(self._names, self._values(item)))) + "\n").encode('utf-8')
+
+    def serialize(self, data: list) -> bytes:
+        return b"".join(map(self._encode, data))
+
+    def deserialize(self, data_bytes: bytes) -> list:
+        return list(self.load(io.BytesIO(data_bytes)))
+
+    def dump(self, items: Iterable, stream: BinaryIO) -> None:
+        stream.writelines(map(self._encode, items))
+
+    def load(self, stream: BinaryIO) -> Iterator:
+        item_type = self.item_type
+        for line in stream:
+            if line.strip():
+                yield item_type(**json.loads(line))
+
+
+NONE_LENGTH = 0xFFFFFFFF
+RECORD_LENGTH = struct.Struct('<I')
+SCALAR_CODES = {int: 'q', float: 'd', bool: '?'}
+BLOB_TYPES = (str, bytes)
+
+
+def _unwrap_optional(annotation) -> tuple[type, bool]:
+    if get_origin(annotation) in (Union, types.UnionType):
+        arguments = tuple(argument for argument in get_args(annotation) if argument is not type(None))
+        if len(arguments) == 1 and len(arguments) < len(get_args(annotation)):
+            return arguments[0], True
+    return annotation, False
+
+
+def compile_record_codec(item_type: type) -> tuple:
+    hints = get_type_hints(item_type)
+    codes = ['<']
+    encode = ["def encode(item):"]
+    packed = []
+    blobs = []
+    decode = ["def decode(data, offset):"]
+    unpacked = []
+    read = []
+    arguments = []
+    for index, field_ in enumerate(field_ for field_ in fields(item_type) if field_.init):
+        annotation, optional = _unwrap_optional(hints[field_.name])
+        value = f"v{index}"
+        encode.append(f"    {value} = item.{field_.name}")
+        if annotation in SCALAR_CODES:
+            if optional:
+                codes.append('?')
+                encode.append(f"    p{index} = {value} is not None")
+                encode.append(f"    {value} = {value} if p{index} else {annotation.__name__}()")
+                packed.append(f"p{index}")
+                unpacked.append(f"p{index}")
+                read.append(f"    {value} = {value} if p{index} else None")
+            codes.append(SCALAR_CODES[annotation])
+            packed.append(value)
+            unpacked.append(value)
+        elif annotation in BLOB_TYPES:
+            codes.append('I')
+            convert = ".encode('utf-8')" if annotation is str else ""
+            restore = ".decode('utf-8')" if annotation is str else ""
+            if optional:
+                encode.append(f"    {value} = b'' if {value} is None else {value}{convert}")
+                encode.append(f"    n{index} = {NONE_LENGTH} if item.{field_.name} is None else len({value})")
+            else:
+                encode.append(f"    {value} = {value}{convert}")
+                encode.append(f"    n{index} = len({value})")
+            packed.append(f"n{index}")
+            blobs.append(value)
+            unpacked.append(f"n{index}")
+            slice_ = f"{value} = data[offset:offset + n{index}]{restore}; offset += n{index}"
+            if optional:
+                read.append(f"    if n{index} == {NONE_LENGTH}:")
+                read.append(f"        {value} = None")
+                read.append("    else:")
+                read.append(f"        {slice_}")
+            else:
+                read.append(f"    {slice_}")
+        else:
+            raise TypeError(f"Unsupported field type for {item_type.__name__}.{field_.name}: {annotation!r}")
+        arguments.append(f"{field_.name}={value}")
+    header = struct.Struct(''.join(codes))
+    encode.append(f"    return _pack({', '.join(packed)}){''.join(f' + {blob}' for blob in blobs)}")
+    decode.append(f"    {', '.join(unpacked)}{',' if len(unpacked) == 1 else ''} = _unpack_from(data, offset)")
+    decode.append(f"    offset += {header.size}")
+    decode.extend(read)
+    decode.append(f"    return _type({', '.join(arguments)})")
+    namespace = {'_pack': header.pack, '_unpack_from': header.unpack_from, '_type': item_type}
+    exec("\n".join(encode + decode), namespace)
+    return namespace['encode'], namespace['decode']
+
+
+class BinarySerializer(IStreamSerializer):
+    def __init__(self, item_type: type = User) -> None:
+        self.item_type = item_type
+        self._encode, self._decode = compile_record_codec(item_type)
+
+    def _frame(self, item) -> bytes:
+        record = self._encode(item)
+        return RECORD_LENGTH.pack(len(record)) + record
+
+    def serialize(self, data: list) -> bytes:
+        return b"".join(map(self._frame, data))
+
+    def deserialize(self, data_bytes: bytes) -> list:
+        decode = self._decode
+        unpack_from = RECORD_LENGTH.unpack_from
+        items = []
+        offset = 0
+        end = len(data_bytes)
+        while offset < end:
+            if offset + RECORD_LENGTH.size > end:
+                raise ValueError("Truncated record")
+            length, = unpack_from(data_bytes, offset)
+            offset += RECORD_LENGTH.size
+            if offset + length > end:
+                raise ValueError("Truncated record")
+            items.append(decode(data_bytes, offset))
+            offset += length
+        return items
+
+    def dump(self, items: Iterable, stream: BinaryIO) -> None:
+        stream.writelines(map(self._frame, items))
+
+    def load(self, stream: BinaryIO) -> Iterator:
+        decode = self._decode
+        while prefix := stream.read(RECORD_LENGTH.size):
+            if len(prefix) < RECORD_LENGTH.size:
+                raise ValueError("Truncated record")
+            length, = RECORD_LENGTH.unpack(prefix)
+            record = stream.read(length)
+            if len(record) < length:
+                raise ValueError("Truncated record")
+            yield decode(record, 0)
@@ -0,0 +1,150 @@
+import queue
+import sqlite3
+import threading
+from contextlib import contextmanager
+from dataclasses import fields
+from operator import attrgetter
+from typing import Iterable, Iterator, Optional, Sequence
+from user import User
+from data_repository import index_by_id
+from user_repository import IUserRepository
+
+COLUMNS = tuple(field_.name for field_ in fields(User))
+row_of = attrgetter(*COLUMNS)
+SELECT = f"SELECT {', '.join(COLUMNS)} FROM users"
+SELECT_ALL = f"{SELECT} ORDER BY position"
+SELECT_BY_ID = f"{SELECT} WHERE id = ?"
+SELECT_BY_LOGIN = f"{SELECT} WHERE login = ? ORDER BY position LIMIT 1"
+INSERT = f"INSERT INTO users ({', '.join(COLUMNS)}) VALUES ({', '.join('?' * len(COLUMNS))})"
+UPDATE = f"UPDATE users SET {', '.join(f'{name} = ?' for name in COLUMNS[1:])} WHERE id = ?"
+UPSERT = f"{INSERT} ON CONFLICT(id) DO UPDATE SET {', '.join(f'{name} = excluded.{name}' for name in COLUMNS[1:])}"
+DELETE = "DELETE FROM users WHERE id = ?"
+SELECT_MANY_CHUNK = 500
+DUPLICATE_KEY_ERRORS = ('SQLITE_CONSTRAINT_PRIMARYKEY', 'SQLITE_CONSTRAINT_UNIQUE')
+SCHEMA = (
+    "CREATE TABLE IF NOT EXISTS users ("
+    "position INTEGER PRIMARY KEY, id INTEGER NOT NULL UNIQUE, login TEXT NOT NULL, password TEXT NOT NULL, "
+    "name TEXT NOT NULL, email TEXT, address TEXT)",
+    "CREATE INDEX IF NOT EXISTS users_login ON users(login, position)",
+)
+
+
+class ConnectionPool:
+    def __init__(self, database: str, size: int = 4) -> None:
+        if size <= 0:
+            raise ValueError("Pool size must be positive")
+        self.database = database
+        self._connections: queue.LifoQueue[sqlite3.Connection] = queue.LifoQueue()
+        self._all: list[sqlite3.Connection] = []
+        self._lock = threading.Lock()
+        self._size = size
+
+    def _connect(self) -> sqlite3.Connection:
+        connection = sqlite3.connect(self.database, check_same_thread=False, cached_statements=64)
+        connection.execute("PRAGMA journal_mode=WAL")
+        connection.execute("PRAGMA synchronous=NORMAL")
+        return connection
+
+    @contextmanager
+    def connection(self) -> Iterator[sqlite3.Connection]:
+        try:
+            connection = self._connections.get_nowait()
+        except queue.Empty:
+            with self._lock:
+                if len(self._all) < self._size:
+                    connection = self._connect()
+                    self._all.append(connection)
+                else:
+                    connection = None
+            if connection is None:
+                connection = self._connections.get()
+        try:
+            yield connection
+        finally:
+            self._connections.put(connection)
+
+    def close(self) -> None:
+        with self._lock:
+            for connection in self._all:
+                connection.close()
+            self._all.clear()
+
+
+class SqliteUserRepository(IUserRepository):
+    def __init__(self, database: str, pool_size: int = 4) -> None:
+        self.database = database
+        self._pool = ConnectionPool(database, pool_size)
+        with self._pool.connection() as connection, connection:
+            for statement in SCHEMA:
+                connection.execute(statement)
+
+    def get_all(self) -> Sequence[User]:
+        with self._pool.connection() as connection:
+            return [User(*row) for row in connection.execute(SELECT_ALL)]
+
+    def get_by_id(self, id: int) -> Optional[User]:
+        return self._fetch_one(SELECT_BY_ID, id)
+
+    def get_by_login(self, login: str) -> Optional[User]:
+        return self._fetch_one(SELECT_BY_LOGIN, login)
+
+    def _fetch_one(self, query: str, value: object) -> Optional[User]:
+        with self._pool.connection() as connection:
+            row = connection.execute(query, (value,)).fetchone()
+        return User(*row) if row is not None else None
+
+    def get_many(self, ids: Iterable[int]) -> list[Optional[User]]:
+        ids = list(ids)
+        by_id = {}
+        with self._pool.connection() as connection:
+            for start in range(0, len(ids), SELECT_MANY_CHUNK):
+                chunk = ids[start:start + SELECT_MANY_CHUNK]
+                query = f"{SELECT} WHERE id IN ({', '.join('?' * len(chunk))})"
+                by_id.update((row[0], row) for row in connection.execute(query, chunk))
+        return [User(*by_id[id]) if id in by_id else None for id in ids]
+
+    def add(self, item: User) -> None:
+        self.add_many((item,))
+
+    def update(self, item: User) -> None:
+        self.update_many((item,))
+
+    def delete(self, item: User) -> None:
+        self.delete_many((item,))
+
+    def add_many(self, items: Iterable[User]) -> None:
+        batch = index_by_id(items)
+        with self._pool.connection() as connection:
+            try:
+                with connection:
+                    connection.executemany(INSERT, map(row_of, batch.values()))
+            except sqlite3.IntegrityError as e:
+                if e.sqlite_errorname not in DUPLICATE_KEY_ERRORS:
+                    raise
+                raise ValueError("Item already exists") from e
+
+    def upsert_many(self, items: Iterable[User]) -> None:
+        batch = index_by_id(items)
+        with self._pool.connection() as connection, connection:
+            connection.executemany(UPSERT, map(row_of, batch.values()))
+
+    def delete_many(self, items: Iterable[User]) -> None:
+        with self._pool.connection() as connection, connection:
+            connection.executemany(DELETE, ((item.id,) for item in items))
+
+    def update_many(self, items: Iterable[User]) -> None:
+        batch = index_by_id(items)
+        with self._pool.connection() as connection, connection:
+            for item in batch.values():
+                values = row_of(item)
+                if connection.execute(UPDATE, values[1:] + values[:1]).rowcount == 0:
+                    raise ValueError("Item not found")
+
+    def close(self) -> None:
+        self._pool.close()
+
+    def __enter__(self) -> 'SqliteUserRepository':
+        return self
+
+    def __exit__(self, *args) -> None:
+        self.close()
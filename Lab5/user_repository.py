@@ -1,5 +1,8 @@
 from typing import Protocol, Optional
 from data_repository import IDataRepository,DataRepository
+from cached_repository import CachedDataRepository
+from log_repository import LogDataRepository
+from serializers import ISerializer
 from user import User
 
 
@@ -10,4 +13,20 @@ class IUserRepository(IDataRepository[User], Protocol):
 
 class UserRepository(DataRepository[User], IUserRepository):
     def get_by_login(self, login: str) -> Optional[User]:
-        return next((user for user in self.get_all() if user.login == login), None)
\ No newline at end of file
+        return next((user for user in self.get_all() if user.login == login), None)
+
+class CachedUserRepository(CachedDataRepository[User], IUserRepository):
+    def __init__(self, filename: str, serializer : ISerializer) -> None:
+        super().__init__(filename, serializer, ('id', 'login'))
+
+    def get_by_login(self, login: str) -> Optional[User]:
+        return self.find_by('login', login)
+
+
+class LogUserRepository(LogDataRepository[User], IUserRepository):
+    def __init__(self, filename: str, serializer : ISerializer, compact_threshold: int = 1 << 20,
+                 fsync: bool = False) -> None:
+        super().__init__(filename, serializer, ('login',), compact_threshold, fsync)
+
+    def get_by_login(self, login: str) -> Optional[User]:
+        return self.find_by('login', login)